@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Scene benchmark - Runs every scene headlessly and compares it with a stored baseline
+
+Each scene runs in its own process under the SDL dummy video driver. It gets
+the same scripted mouse input on every run, a seeded RNG, and a virtual game
+clock that advances exactly one frame per frame, so every run does the same work.
+Per scene it reports:
+- frames per second of the full main-loop frame (events, update, draw, flip)
+- Python memory allocated per frame (tracemalloc peak above the frame's start;
+  SDL pixel buffers are not traced)
+- the process's peak RSS
+
+With --baseline the results are compared to a stored report, and the exit
+status is 1 when a scene is slower or uses more memory than the tolerance
+allows, so CI can gate rendering changes.
+
+Usage:
+    python -m benchmarks.scene_benchmark --frames 300 --baseline benchmarks/baseline.json
+    python -m benchmarks.scene_benchmark --update-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+# Must be set before pygame initializes the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+DEFAULT_FRAMES = 300
+WARMUP_FRAMES = 30
+DEFAULT_TOLERANCE = 0.25
+
+# Metrics compared with the baseline; True means higher is better
+METRICS = {
+    "fps": True,
+    "alloc_kb_per_frame": False,
+    "peak_rss_mb": False,
+}
+
+
+def scene_names():
+    """Names of all benchmarked scenes (one battle per guardian)"""
+    from src.utils.catalog import CATALOG
+
+    names = ["TitleScene", "NameInputScene", "PrologueScene", "MapScene"]
+    names += [f"BattleScene[{guardian['name']}]" for guardian in CATALOG.guardians]
+    names += ["EventScene", "BattleResultScene", "GameOverScene", "EndingScene"]
+    return names
+
+
+def build_scene(name, scene_manager):
+    """Create a scene by benchmark name"""
+    from src.scenes.title_scene import TitleScene
+    from src.scenes.name_input_scene import NameInputScene
+    from src.scenes.prologue_scene import PrologueScene
+    from src.scenes.map_scene import MapScene
+    from src.scenes.battle_scene import BattleScene
+    from src.scenes.event_scene import EventScene
+    from src.scenes.battle_result_scene import BattleResultScene
+    from src.scenes.game_over_scene import GameOverScene
+    from src.scenes.ending_scene import EndingScene
+    from src.utils.catalog import CATALOG
+
+    if name.startswith("BattleScene["):
+        return BattleScene(scene_manager, CATALOG.guardian(name[len("BattleScene["):-1]))
+    if name == "EventScene":
+        item = CATALOG.items[0]
+        return EventScene(scene_manager, "アイテム発見！", [
+            f"{CATALOG.areas[0]}を探索していると、キラリと光るものが目に入った。",
+            f"{item['name']}を見つけた！",
+            f"「{item['description']}」",
+        ])
+    if name == "BattleResultScene":
+        return BattleResultScene(scene_manager, CATALOG.guardians[0], "victory")
+
+    scene_classes = {
+        "TitleScene": TitleScene,
+        "NameInputScene": NameInputScene,
+        "PrologueScene": PrologueScene,
+        "MapScene": MapScene,
+        "GameOverScene": GameOverScene,
+        "EndingScene": EndingScene,
+    }
+    return scene_classes[name](scene_manager)
+
+
+def scripted_events(name, frame):
+    """Input for a frame: the mouse sweeps over the screen, and the name input gets typed into"""
+    import pygame
+    from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    x = int(SCREEN_WIDTH / 2 + SCREEN_WIDTH * 0.45 * math.sin(frame * 0.05))
+    y = int(SCREEN_HEIGHT / 2 + SCREEN_HEIGHT * 0.45 * math.sin(frame * 0.07))
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))]
+
+    if name == "NameInputScene":
+        if frame == 0:
+            # Focus the text input
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), button=1))
+        elif frame % 10 == 0:
+            # Type a few characters, then delete them again
+            if frame % 80 < 40:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a", mod=0, scancode=0))
+            else:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="\b", mod=0, scancode=0))
+    return events
+
+
+def run_scene(name, frames=DEFAULT_FRAMES, seed=0):
+    """Benchmark one scene (runs in a fresh worker process)"""
+    import pygame
+
+    from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+    from src.utils.game_clock import GameClock, VirtualClock
+
+    # Game time advances by exactly one frame per frame, so animations are reproducible
+    virtual_time = VirtualClock()
+    clock = GameClock(virtual_time)
+
+    random.seed(seed)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from src.scenes.scene_manager import SceneManager
+    from src.utils.assets import assets
+
+    scene_manager = SceneManager(clock)
+    scene_manager.set_player_name("ベンチマーク")
+    scene_manager.change_scene(build_scene(name, scene_manager))
+
+    # Finish all image loads so every frame draws the same thing
+    assets.wait_all()
+
+    def frame(index):
+        clock.begin_frame()
+        for event in scripted_events(name, index):
+            scene_manager.handle_event(event)
+        scene_manager.update()
+        screen.fill((0, 0, 0))
+        scene_manager.draw(screen)
+        pygame.display.flip()
+        virtual_time.advance(1000 / FPS)
+
+    for index in range(WARMUP_FRAMES):
+        frame(index)
+
+    # Timing pass
+    start = time.perf_counter()
+    for index in range(WARMUP_FRAMES, WARMUP_FRAMES + frames):
+        frame(index)
+    elapsed = time.perf_counter() - start
+
+    # Allocation pass (tracemalloc slows everything down, so it isn't timed)
+    tracemalloc.start()
+    allocated = 0
+    for index in range(WARMUP_FRAMES + frames, WARMUP_FRAMES + frames * 2):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        frame(index)
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    assets.shutdown()
+    pygame.quit()
+
+    return {
+        "frames": frames,
+        "fps": round(frames / elapsed, 1),
+        "ms_per_frame": round(elapsed / frames * 1000, 3),
+        "alloc_kb_per_frame": round(allocated / frames / 1024, 2),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_benchmarks(names, frames=DEFAULT_FRAMES, seed=0):
+    """Benchmark each scene in its own process, so peak RSS is per scene"""
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(run_scene, name, frames, seed).result()
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Get (scene, metric, baseline value, value) for every metric that regressed beyond the tolerance"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            expected, value = reference.get(metric), result[metric]
+            if expected is None:
+                continue
+            if higher_is_better:
+                regressed = value < expected * (1 - tolerance)
+            else:
+                regressed = value > expected * (1 + tolerance)
+            if regressed:
+                regressions.append((name, metric, expected, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless per-scene frame rate and memory benchmark")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="measured frames per scene")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--scene", action="append", help="only run this scene (can be repeated)")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare with a baseline JSON and fail on regressions")
+    parser.add_argument("--update-baseline", metavar="PATH", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative regression (default: 0.25)")
+    args = parser.parse_args()
+
+    names = args.scene or scene_names()
+    results = run_benchmarks(names, args.frames, args.seed)
+
+    print(f"{'scene':<30}{'fps':>10}{'ms/frame':>10}{'alloc kB/frame':>16}{'peak RSS MB':>13}")
+    for name, result in results.items():
+        print(f"{name:<30}{result['fps']:>10.1f}{result['ms_per_frame']:>10.3f}"
+              f"{result['alloc_kb_per_frame']:>16.2f}{result['peak_rss_mb']:>13.1f}")
+
+    for path in (args.output, args.update_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, metric, expected, value in regressions:
+            print(f"REGRESSION {name} {metric}: {value} (baseline {expected})")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,57 @@ Amazon Forest Quest: The Treasure and Seven AWS Guardians
 A Pygame RPG game about AWS services
 """
 
+import argparse
+import random
 import pygame
 import sys
 import os
 from src.scenes.scene_manager import SceneManager
 from src.scenes.title_scene import TitleScene
-from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE
+from src.ui.input_router import allow_game_events
+from src.utils.fonts import preload_fonts
+from src.utils.dirty_rects import consume_dirty_rects
+from src.utils.frame_scheduler import FrameScheduler
+from src.utils.event_pump import snapshot_input
+from src.utils.fixed_timestep import FixedTimestep
+from src.utils.assets import assets
+from src.utils.profiler import profiler, PROFILE_REPORT_PATH
+from src.utils.game_clock import GameClock, FastForwardClock
+from src.utils.input_log import InputRecorder, SEED_MIN, SEED_MAX
+from src.utils.save_game import save_writer, SaveGameError
+from src.utils.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, DIRTY_RECT_RENDERING, MAX_UPDATES_PER_FRAME,
+    AUTOSAVE_SLOT, SAVE_SLOTS
+)
 
 def main():
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--profile", nargs="?", const=PROFILE_REPORT_PATH, metavar="PATH",
+                        help="record frame times from the start and write the report on exit")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the input and random seed for python -m src.utils.replay")
+    parser.add_argument("--seed", type=int, help="random seed (a fresh one is recorded by default)")
+    parser.add_argument("--load", type=int, nargs="?", const=AUTOSAVE_SLOT, metavar="SLOT",
+                        help=f"continue from a save slot (0-{SAVE_SLOTS - 1}, the autosave by default)")
+    parser.add_argument("--speed", type=float, default=1.0, metavar="N",
+                        help="fast-forward: run the game N times faster than real time")
+    args = parser.parse_args()
+    if not args.speed > 0:
+        parser.error("--speed must be greater than 0")
+    if args.load is not None and not 0 <= args.load < SAVE_SLOTS:
+        parser.error(f"--load: slot must be between 0 and {SAVE_SLOTS - 1}")
+    if args.load is not None and args.record:
+        parser.error("--record replays from the title screen and can't be combined with --load")
+    if args.seed is not None and args.record and not SEED_MIN <= args.seed <= SEED_MAX:
+        parser.error(f"--seed must be between {SEED_MIN} and {SEED_MAX} to be recorded")
+    
+    # Seed the RNG so a recorded session can be replayed with the same battle rolls
+    seed = args.seed
+    if seed is None and args.record:
+        seed = random.SystemRandom().getrandbits(63)
+    if seed is not None:
+        random.seed(seed)
+    
     # Initialize pygame
     pygame.init()
     
@@ -25,44 +68,131 @@ def main():
     
     pygame.font.init()
     
+    # Load the shared fonts once so scene changes don't parse font files
+    preload_fonts()
+    
     # Set up the display
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption(GAME_TITLE)
     
-    # Set up the clock for a decent framerate
-    clock = pygame.time.Clock()
+    # Event types no scene reacts to never reach the queue
+    allow_game_events()
+    
+    # Set up the scheduler: full framerate while animating, sleep on input when idle
+    scheduler = FrameScheduler(FPS)
+    
+    # Game time follows the pygame timer, or runs N times faster when fast-forwarding
+    clock = GameClock(FastForwardClock(args.speed) if args.speed != 1 else None)
+    
+    # Scene logic runs in fixed steps, drawing happens once per frame;
+    # fast-forwarding runs proportionally more steps per frame
+    timestep = FixedTimestep(max_steps=int(MAX_UPDATES_PER_FRAME * max(args.speed, 1)),
+                             time_source=clock.source.get_ticks)
+    
+    # Initialize scene manager with title scene (or the loaded save); scene changes autosave
+    start_ticks = clock.begin_frame(timestep.start())
+    scene_manager = SceneManager(clock)
+    scene_manager.autosave_slot = AUTOSAVE_SLOT
+    try:
+        loaded = args.load is not None and scene_manager.load_game(args.load)
+    except SaveGameError as e:
+        print(f"Warning: Could not load save slot {args.load}: {e}")
+        loaded = False
+    if not loaded:
+        scene_manager.show_scene(TitleScene)
     
-    # Initialize scene manager with title scene
-    scene_manager = SceneManager()
-    scene_manager.change_scene(TitleScene(scene_manager))
+    # F3 shows the profiler overlay; --profile records from the first frame
+    if args.profile:
+        profiler.report_path = args.profile
+        profiler.enable()
+    
+    recorder = InputRecorder(args.record, seed, start_ticks) if args.record else None
+    
+    # Input waiting for the next logic step
+    pending_events = []
+    input_snapshot = None
     
     # Main game loop
     running = True
     while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
+        profiler.begin_frame(scene_manager.get_active_scene())
+        
+        # Collect events
+        with profiler.section("events"):
+            for event in scheduler.get_events():
+                if event.type == pygame.QUIT:
+                    running = False
+                
+                # Profiler keys don't reach the scene
+                if profiler.handle_event(event):
+                    continue
+                
+                pending_events.append(event)
+        
+        # Run the logic steps due by now; input goes to the first one
+        for ticks in timestep.steps():
+            # Everything in a step sees the same time
+            clock.begin_frame(ticks)
             
-            # Pass events to current scene
-            scene_manager.handle_event(event)
+            with profiler.section("events"):
+                # One snapshot per step, with redundant motion merged away
+                input_snapshot = snapshot_input(pending_events, input_snapshot)
+                scene_manager.handle_input(input_snapshot)
+            
+            with profiler.section("update"):
+                scene_manager.update()
+            
+            if recorder:
+                recorder.record_frame(ticks, input_snapshot.events)
+            pending_events = []
         
-        # Update current scene
-        scene_manager.update()
+        # The canvas is the screen unless the profiler is counting render calls
+        canvas = profiler.get_canvas(screen)
         
-        # Clear the screen
-        screen.fill((0, 0, 0))
+        if DIRTY_RECT_RENDERING:
+            # Redraw only the regions that changed since the last frame
+            dirty_rects = consume_dirty_rects()
+            if dirty_rects:
+                clip = dirty_rects[0].unionall(dirty_rects[1:])
+                with profiler.section("draw"):
+                    canvas.set_clip(clip)
+                    canvas.fill((0, 0, 0))
+                    scene_manager.draw(canvas)
+                    canvas.set_clip(None)
+                with profiler.section("present"):
+                    screen.set_clip(clip)
+                    profiler.present(screen, canvas, clip)
+                    screen.set_clip(None)
+                    pygame.display.update(dirty_rects)
+        else:
+            with profiler.section("draw"):
+                # Clear the screen
+                canvas.fill((0, 0, 0))
+                
+                # Draw current scene
+                scene_manager.draw(canvas)
+            
+            with profiler.section("present"):
+                profiler.present(screen, canvas)
+                
+                # Update the display
+                pygame.display.flip()
         
-        # Draw current scene
-        scene_manager.draw(screen)
+        profiler.end_frame()
         
-        # Update the display
-        pygame.display.flip()
+        # Move finished (prefetched) images into the cache, where its budget applies
+        assets.collect()
         
-        # Cap the framerate
-        clock.tick(FPS)
+        # Cap the framerate, or wait for input if nothing is animating
+        scheduler.wait_for_next_frame(scene_manager.is_animating() or bool(pending_events))
     
     # Clean up
+    if args.profile:
+        profiler.export()
+    if recorder:
+        recorder.close()
+    assets.shutdown()
+    save_writer.shutdown()
     pygame.quit()
     sys.exit()
 
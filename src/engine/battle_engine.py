@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Battle Engine - Resolves battles with AWS Guardians without pygame
+
+The engine works on a guardian record from the catalog and the PlayerState
+from the SceneManager. All randomness goes through the given rng, so a
+seeded random.Random makes battles reproducible.
+"""
+
+import random
+from collections import namedtuple
+from src.utils.catalog import CATALOG
+
+# Damage model
+LEVEL_DAMAGE_SCALING = 0.2  # +20% skill damage per level above 1
+WEAKNESS_MULTIPLIER = 2
+CRITICAL_CHANCE = 0.2
+CRITICAL_MULTIPLIER = 1.5
+GUARDIAN_DAMAGE_MIN = 10
+GUARDIAN_DAMAGE_MAX = 20
+ESCAPE_CHANCE = 0.5
+
+# Reward for clearing a trial
+VICTORY_AWS_KNOWLEDGE = 50
+
+AttackResult = namedtuple("AttackResult", ["damage", "critical", "weakness_hit", "defeated"])
+GuardianAttack = namedtuple("GuardianAttack", ["attack", "damage", "defeated"])
+
+
+def apply_stat_change(player_data, stat, value):
+    """Change a player stat, clamped at 0. Returns True on level up."""
+    if stat in player_data:
+        player_data[stat] += value
+        
+        # Ensure stats don't go below 0
+        if player_data[stat] < 0:
+            player_data[stat] = 0
+            
+        # Check for level up based on AWS knowledge
+        if stat == "aws_knowledge":
+            new_level = 1 + (player_data["aws_knowledge"] // 100)
+            if new_level > player_data["level"]:
+                player_data["level"] = new_level
+                return True  # Indicates level up
+    
+    return False
+
+
+class BattleEngine:
+    def __init__(self, guardian, player_data, rng=random):
+        self.guardian = guardian
+        self.player_data = player_data
+        self.rng = rng
+        
+        self.guardian_hp = guardian["hp"]
+        self.max_guardian_hp = guardian["hp"]
+        self.turns = 0
+        self.result = None  # None while fighting, then "victory", "defeat" or "escape"
+    
+    def is_over(self):
+        """Check if the battle has ended"""
+        return self.result is not None
+    
+    def player_attack(self, skill_name, command):
+        """Attack with a skill and an AWS command. Returns None for unknown skills."""
+        skill_details = CATALOG.skill(skill_name)
+        if not skill_details:
+            return None
+        
+        self.turns += 1
+        
+        # Calculate damage based on skill power and player level
+        base_damage = skill_details["power"]
+        player_level = self.player_data["level"]
+        damage = base_damage * (1 + (player_level - 1) * LEVEL_DAMAGE_SCALING)
+        
+        # Check if command contains keywords related to guardian's weakness
+        weakness_hit = self.guardian["weakness"].lower() in command.lower()
+        if weakness_hit:
+            damage *= WEAKNESS_MULTIPLIER
+            critical = True
+        else:
+            critical = self.rng.random() < CRITICAL_CHANCE
+            if critical:
+                damage *= CRITICAL_MULTIPLIER
+        
+        # Apply damage
+        damage = int(damage)
+        self.guardian_hp -= damage
+        
+        defeated = self.guardian_hp <= 0
+        if defeated:
+            self.guardian_hp = 0
+            self.result = "victory"
+            
+            # Mark trial as completed and award AWS knowledge
+            self.player_data.complete_trial(self.guardian["name"])
+            apply_stat_change(self.player_data, "aws_knowledge", VICTORY_AWS_KNOWLEDGE)
+        
+        return AttackResult(damage, critical, weakness_hit, defeated)
+    
+    def use_item(self, item_name):
+        """Use an item from the inventory. Returns the item's effects, or None if unusable or not owned."""
+        item_details = CATALOG.item(item_name)
+        if not item_details or not self.player_data.remove_item(item_name):
+            return None
+        
+        self.turns += 1
+        
+        # Apply item effects (damage_reduction has no stat to change)
+        for stat, value in item_details["effect"].items():
+            if stat != "damage_reduction":
+                apply_stat_change(self.player_data, stat, value)
+        
+        return item_details["effect"]
+    
+    def try_escape(self):
+        """Try to run away. Returns True on success."""
+        self.turns += 1
+        if self.rng.random() < ESCAPE_CHANCE:
+            self.result = "escape"
+            return True
+        return False
+    
+    def guardian_attack(self):
+        """Resolve the guardian's counterattack"""
+        # Select random attack pattern
+        attack = self.rng.choice(self.guardian["attack_patterns"])
+        
+        # Calculate damage and apply it to player stats
+        damage = self.rng.randint(GUARDIAN_DAMAGE_MIN, GUARDIAN_DAMAGE_MAX)
+        apply_stat_change(self.player_data, "motivation", -damage)
+        apply_stat_change(self.player_data, "concentration", -damage // 2)
+        
+        # Check if player is defeated
+        defeated = self.player_data.motivation <= 0
+        if defeated:
+            self.result = "defeat"
+        
+        return GuardianAttack(attack, damage, defeated)
+
+
+def weakness_policy(engine):
+    """Player policy: attack with the strongest known skill, naming the guardian's weakness"""
+    skills = [CATALOG.skill(name) for name in engine.player_data.skills]
+    best_skill = max(skills, key=lambda s: s["power"])
+    return ("attack", best_skill["name"], engine.guardian["weakness"])
+
+
+def simulate_battle(guardian, player_data, policy=weakness_policy, rng=random, max_turns=100):
+    """
+    Fight a whole battle headlessly and return the finished engine.
+    
+    The policy is called each turn with the engine and returns one of
+    ("attack", skill_name, command), ("item", item_name) or ("run",).
+    """
+    engine = BattleEngine(guardian, player_data, rng)
+    
+    while engine.result is None and engine.turns < max_turns:
+        action = policy(engine)
+        
+        if action[0] == "attack":
+            if engine.player_attack(action[1], action[2]) is None:
+                break
+        elif action[0] == "item":
+            if engine.use_item(action[1]) is None:
+                break
+        elif engine.try_escape():
+            break
+        
+        if engine.result is None:
+            engine.guardian_attack()
+    
+    return engine
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Campaign simulator - Plays complete games headlessly across a process pool
+
+A run starts like a fresh game after the name input and explores areas with
+the same rules as the map (battles, items, hints and rests) until all seven
+trials are cleared (ending) or motivation runs out (game over). Runs that
+reach the step limit first are reported as unfinished, not as game overs.
+
+Usage:
+    python -m src.engine.campaign --runs 100000 --policy focused --workers 8
+"""
+
+import argparse
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from src.engine.battle_engine import simulate_battle
+from src.engine.exploration import explore_area
+from src.entities.player_state import PlayerState
+from src.utils.catalog import CATALOG
+
+# Items that restore motivation, in the order a player would use them
+RECOVERY_ITEMS = ["モチベーションクッキー", "クラウドエッセンス"]
+LOW_MOTIVATION = 30
+
+# Command typed when the player doesn't know the guardian's weakness
+DEFAULT_COMMAND = "aws help"
+
+
+class RandomExplorer:
+    """Explores random areas and only names a weakness after hearing the hint"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.known_weaknesses = set()
+
+    def choose_area(self, player_data):
+        return self.rng.choice(CATALOG.areas)
+
+    def on_hint(self, guardian):
+        self.known_weaknesses.add(guardian["name"])
+
+    def battle_action(self, engine):
+        player_data = engine.player_data
+
+        # Recover before the guardian can finish us off
+        if player_data.motivation < LOW_MOTIVATION:
+            for item_name in RECOVERY_ITEMS:
+                if player_data.has_item(item_name):
+                    return ("item", item_name)
+
+        if engine.guardian["name"] in self.known_weaknesses:
+            command = engine.guardian["weakness"]
+        else:
+            command = DEFAULT_COMMAND
+        return ("attack", next(reversed(player_data.skills)), command)
+
+
+class FocusedExplorer(RandomExplorer):
+    """Heads for areas whose guardian is still undefeated"""
+
+    def choose_area(self, player_data):
+        remaining = [g["area"] for g in CATALOG.guardians if not player_data.has_completed(g["name"])]
+        return self.rng.choice(remaining or CATALOG.areas)
+
+
+POLICIES = {
+    "random": RandomExplorer,
+    "focused": FocusedExplorer,
+}
+
+
+def play_campaign(policy_class=FocusedExplorer, rng=random, max_steps=1000):
+    """
+    Play one game from the first map visit to the ending or game over.
+
+    Returns a dict with "completed", "unfinished" (stopped at max_steps),
+    "steps" (areas explored), "battles", "level" and "cause" (the guardian
+    that ended the run in a defeat, or None).
+    """
+    player_data = PlayerState("simulated")
+    policy = policy_class(rng)
+    guardian_count = len(CATALOG.guardians)
+    battles = 0
+    completed = False
+    cause = None
+
+    for step in range(1, max_steps + 1):
+        area = policy.choose_area(player_data)
+        event_type, detail = explore_area(area, player_data, rng)
+
+        if event_type == "hint":
+            policy.on_hint(detail)
+        elif event_type == "battle":
+            battles += 1
+            engine = simulate_battle(detail, player_data, policy.battle_action, rng)
+            if engine.result == "defeat":
+                cause = detail["name"]
+                break
+
+        if len(player_data.completed_trials) == guardian_count:
+            completed = True
+            break
+
+    return {
+        "completed": completed,
+        "unfinished": not completed and cause is None,
+        "steps": step,
+        "battles": battles,
+        "level": player_data.level,
+        "cause": cause,
+    }
+
+
+def _run_chunk(args):
+    """Worker entry point: play a chunk of runs with its own seeded RNG"""
+    seed, chunk_index, runs, policy_name, max_steps = args
+    rng = random.Random(f"{seed}-{chunk_index}")
+    policy_class = POLICIES[policy_name]
+
+    completed = 0
+    unfinished = 0
+    steps = Counter()
+    causes = Counter()
+    for _ in range(runs):
+        result = play_campaign(policy_class, rng, max_steps)
+        completed += result["completed"]
+        unfinished += result["unfinished"]
+        steps[result["steps"]] += 1
+        if result["cause"]:
+            causes[result["cause"]] += 1
+    return completed, unfinished, steps, causes
+
+
+def run_campaigns(runs, policy="focused", workers=None, seed=0, chunk_size=1000, max_steps=1000):
+    """
+    Play many games in parallel and aggregate the results.
+
+    Runs are split into chunks with their own seed, so the results only depend
+    on the seed and chunk size, not on the number of workers.
+    """
+    chunks = []
+    for chunk_index, start in enumerate(range(0, runs, chunk_size)):
+        chunks.append((seed, chunk_index, min(chunk_size, runs - start), policy, max_steps))
+
+    if workers == 1:
+        results = map(_run_chunk, chunks)
+        return _aggregate(runs, results)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _aggregate(runs, executor.map(_run_chunk, chunks))
+
+
+def _aggregate(runs, results):
+    completed = 0
+    unfinished = 0
+    steps = Counter()
+    causes = Counter()
+    for chunk_completed, chunk_unfinished, chunk_steps, chunk_causes in results:
+        completed += chunk_completed
+        unfinished += chunk_unfinished
+        steps.update(chunk_steps)
+        causes.update(chunk_causes)
+
+    return {
+        "runs": runs,
+        "completion_rate": completed / runs if runs else 0.0,
+        # Runs that hit the step limit before an ending or game over
+        "unfinished": unfinished,
+        "run_length": _percentiles(steps, (50, 90, 99)),
+        "game_over_causes": dict(causes.most_common()),
+    }
+
+
+def _percentiles(counts, percentiles):
+    total = sum(counts.values())
+    result = {}
+    if not total:
+        return result
+
+    ordered = sorted(counts.items())
+    for p in percentiles:
+        target = total * p / 100
+        seen = 0
+        for value, count in ordered:
+            seen += count
+            if seen >= target:
+                result[f"p{p}"] = value
+                break
+    result["mean"] = sum(value * count for value, count in ordered) / total
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate complete games and report how many players finish")
+    parser.add_argument("--runs", type=int, default=10000, help="number of games to play")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="focused", help="player policy")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    report = run_campaigns(args.runs, args.policy, args.workers, args.seed)
+
+    print(f"runs:            {report['runs']}")
+    print(f"completion rate: {report['completion_rate']:.3f}")
+    print(f"unfinished:      {report['unfinished']}")
+    print(f"run length:      {report['run_length']}")
+    print("game over causes:")
+    for cause, count in report["game_over_causes"].items():
+        print(f"  {cause}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Exploration rules - Decides what happens when the player explores an area, without pygame
+"""
+
+import random
+from src.engine.battle_engine import apply_stat_change
+from src.utils.catalog import CATALOG
+
+# Chance of each outcome when entering an area
+AREA_EVENTS = ["battle", "item", "hint", "nothing"]
+AREA_EVENT_WEIGHTS = [0.4, 0.3, 0.2, 0.1]
+
+# Events rolled when there is no battle
+RANDOM_EVENTS = ["item", "hint", "rest"]
+REST_RECOVERY = 20
+
+
+def explore_area(area, player_data, rng=random):
+    """
+    Roll what happens in an area and apply its effects to the player data.
+    
+    Returns ("battle", guardian), ("item", item), ("hint", guardian) or ("rest", None).
+    A battle is only returned for guardians that haven't been defeated yet.
+    """
+    event_type = rng.choices(AREA_EVENTS, weights=AREA_EVENT_WEIGHTS, k=1)[0]
+    
+    if event_type == "battle":
+        # Find guardian for this area
+        guardian = CATALOG.guardian_for_area(area)
+        
+        # A defeated guardian gives way to a different event
+        if not guardian or not player_data.has_completed(guardian["name"]):
+            return ("battle", guardian)
+    
+    return random_event(player_data, rng)
+
+
+def random_event(player_data, rng=random):
+    """Roll a non-battle event and apply its effects to the player data"""
+    event_type = rng.choice(RANDOM_EVENTS)
+    
+    if event_type == "item":
+        item = rng.choice(CATALOG.items)
+        player_data.add_item(item["name"])
+        return ("item", item)
+    
+    elif event_type == "hint":
+        guardian = rng.choice(CATALOG.guardians)
+        return ("hint", guardian)
+    
+    # Rest to recover stats
+    apply_stat_change(player_data, "motivation", REST_RECOVERY)
+    apply_stat_change(player_data, "concentration", REST_RECOVERY)
+    return ("rest", None)
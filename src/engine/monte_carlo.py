@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Monte Carlo balance simulator - Runs many battles at once as NumPy array operations
+
+Uses the same damage model as the battle engine: skill power scaled by level,
+2x on the guardian's weakness, otherwise a 20% chance of a 1.5x critical hit,
+and a 10-20 motivation counterattack after every turn the guardian survives.
+
+Usage:
+    python -m src.engine.monte_carlo --battles 100000 --seed 1
+"""
+
+import argparse
+import numpy as np
+from src.engine.battle_engine import (
+    LEVEL_DAMAGE_SCALING, WEAKNESS_MULTIPLIER, CRITICAL_CHANCE, CRITICAL_MULTIPLIER,
+    GUARDIAN_DAMAGE_MIN, GUARDIAN_DAMAGE_MAX
+)
+from src.utils.catalog import CATALOG
+from src.utils.constants import INITIAL_MOTIVATION
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class BatchResult:
+    """Outcome arrays for a batch of battles, shaped (configs, battles)"""
+
+    def __init__(self, victory, turns, motivation):
+        self.victory = victory
+        self.turns = turns
+        self.motivation = motivation
+
+    def win_rate(self):
+        """Win rate per configuration"""
+        return self.victory.mean(axis=-1)
+
+    def summary(self, config=0):
+        """Win rate and distributions of turns to win and motivation left for one configuration"""
+        victory = self.victory[config]
+        turns_to_win = self.turns[config][victory]
+        motivation_left = self.motivation[config][victory]
+
+        return {
+            "battles": int(victory.size),
+            "win_rate": float(victory.mean()),
+            "turns_to_win": _distribution(turns_to_win),
+            "motivation_left": _distribution(motivation_left),
+        }
+
+
+def simulate_battles(hp, skill_power, level=1, battles=10000, weakness_rate=1.0,
+                     motivation=INITIAL_MOTIVATION, max_turns=100, rng=None):
+    """
+    Simulate battles for one or more configurations at once.
+
+    hp and skill_power may be scalars or 1-D arrays of the same length (one
+    entry per configuration). weakness_rate is the chance that the player's
+    command names the guardian's weakness on a given turn.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    hp = np.atleast_1d(np.asarray(hp, dtype=np.float64))
+    skill_power = np.atleast_1d(np.asarray(skill_power, dtype=np.float64))
+    hp, skill_power = np.broadcast_arrays(hp, skill_power)
+    shape = (hp.size, battles)
+
+    guardian_hp = np.repeat(hp[:, None], battles, axis=1)
+    base_damage = (skill_power * (1 + (level - 1) * LEVEL_DAMAGE_SCALING))[:, None]
+    player_motivation = np.full(shape, motivation, dtype=np.int64)
+    turns = np.zeros(shape, dtype=np.int64)
+    victory = np.zeros(shape, dtype=bool)
+    active = np.ones(shape, dtype=bool)
+
+    for _ in range(max_turns):
+        if not active.any():
+            break
+
+        # Player attack: weakness doubles damage, otherwise a chance of a critical hit
+        weakness_hit = rng.random(shape) < weakness_rate
+        critical = ~weakness_hit & (rng.random(shape) < CRITICAL_CHANCE)
+        multiplier = np.where(weakness_hit, WEAKNESS_MULTIPLIER, np.where(critical, CRITICAL_MULTIPLIER, 1.0))
+        damage = np.floor(base_damage * multiplier)
+
+        guardian_hp -= np.where(active, damage, 0)
+        turns += active
+        won = active & (guardian_hp <= 0)
+        victory |= won
+        active &= ~won
+
+        # Guardian counterattack for battles still running
+        guardian_damage = rng.integers(GUARDIAN_DAMAGE_MIN, GUARDIAN_DAMAGE_MAX + 1, shape)
+        player_motivation -= np.where(active, guardian_damage, 0)
+        active &= player_motivation > 0
+
+    np.maximum(player_motivation, 0, out=player_motivation)
+    return BatchResult(victory, turns, player_motivation)
+
+
+def simulate_guardians(battles=10000, level=1, weakness_rate=1.0, rng=None):
+    """Simulate every guardian with the strongest skill for the level"""
+    skill = max(CATALOG.skills_for_level(level), key=lambda s: s["power"])
+    hp = [guardian["hp"] for guardian in CATALOG.guardians]
+
+    result = simulate_battles(hp, skill["power"], level, battles, weakness_rate, rng=rng)
+    return {guardian["name"]: result.summary(i) for i, guardian in enumerate(CATALOG.guardians)}
+
+
+def sweep(hp_values, skill_powers, level=1, battles=1000, weakness_rate=1.0, rng=None):
+    """
+    Simulate every (hp, skill power) combination.
+
+    Returns the win rate grid shaped (len(hp_values), len(skill_powers)).
+    """
+    hp_grid, power_grid = np.meshgrid(hp_values, skill_powers, indexing="ij")
+    result = simulate_battles(hp_grid.ravel(), power_grid.ravel(), level, battles, weakness_rate, rng=rng)
+    return result.win_rate().reshape(hp_grid.shape)
+
+
+def _distribution(values):
+    if values.size == 0:
+        return None
+    stats = {"mean": float(values.mean())}
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        stats[f"p{p}"] = float(value)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balance report for all guardians")
+    parser.add_argument("--battles", type=int, default=100000, help="battles per guardian")
+    parser.add_argument("--level", type=int, default=1, help="player level")
+    parser.add_argument("--weakness-rate", type=float, default=1.0,
+                        help="chance that a command names the guardian's weakness")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    report = simulate_guardians(args.battles, args.level, args.weakness_rate, rng)
+
+    print(f"{'guardian':<18}{'win rate':>10}{'turns p50':>11}{'turns p95':>11}{'motivation p50':>16}")
+    for name, summary in report.items():
+        turns = summary["turns_to_win"] or {}
+        motivation = summary["motivation_left"] or {}
+        print(f"{name:<18}{summary['win_rate']:>10.3f}{turns.get('p50', float('nan')):>11.1f}"
+              f"{turns.get('p95', float('nan')):>11.1f}{motivation.get('p50', float('nan')):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
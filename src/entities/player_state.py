@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Player State - Compact model of the player's progress
+
+Skills and completed trials are dicts used as insertion-ordered sets, and the
+inventory is a Counter of item name -> count. Scenes that still read the
+player like the old player_data dict (player_data["items"], ...) get plain
+values and lists through the mapping accessor.
+"""
+
+from collections import Counter
+from src.utils.constants import INITIAL_MOTIVATION, INITIAL_AWS_KNOWLEDGE, INITIAL_CONCENTRATION
+
+STARTING_SKILL = "基本コマンド"
+
+# Numeric fields that can be read and written through player_data[stat]
+STAT_FIELDS = ("motivation", "aws_knowledge", "concentration", "level")
+COLLECTION_FIELDS = ("items", "skills", "completed_trials")
+
+
+class PlayerState:
+    __slots__ = (
+        "name", "motivation", "aws_knowledge", "concentration", "level",
+        "items", "skills", "completed_trials",
+    )
+
+    def __init__(self, name=""):
+        self.name = name
+        self.motivation = INITIAL_MOTIVATION
+        self.aws_knowledge = INITIAL_AWS_KNOWLEDGE
+        self.concentration = INITIAL_CONCENTRATION
+        self.level = 1
+        self.items = Counter()
+        self.skills = {STARTING_SKILL: None}
+        self.completed_trials = {}
+
+    # Mapping accessor compatible with the old player_data dict
+
+    def __getitem__(self, key):
+        if key == "items":
+            return list(self.items.elements())
+        if key in ("skills", "completed_trials"):
+            return list(getattr(self, key))
+        if key == "name" or key in STAT_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key != "name" and key not in STAT_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key == "name" or key in STAT_FIELDS or key in COLLECTION_FIELDS
+
+    # Inventory
+
+    def add_item(self, item_name):
+        """Add an item to the inventory"""
+        self.items[item_name] += 1
+
+    def remove_item(self, item_name):
+        """Remove one of an item from the inventory. Returns False if there is none."""
+        count = self.items.get(item_name, 0)
+        if not count:
+            return False
+        if count == 1:
+            del self.items[item_name]
+        else:
+            self.items[item_name] = count - 1
+        return True
+
+    def has_item(self, item_name):
+        """Check if the inventory holds at least one of an item"""
+        return item_name in self.items
+
+    # Skills and trials
+
+    def add_skill(self, skill_name):
+        """Learn a skill"""
+        self.skills[skill_name] = None
+
+    def has_skill(self, skill_name):
+        """Check if a skill has been learned"""
+        return skill_name in self.skills
+
+    def complete_trial(self, guardian_name):
+        """Mark a guardian's trial as completed"""
+        self.completed_trials[guardian_name] = None
+
+    def has_completed(self, guardian_name):
+        """Check if a guardian's trial is completed"""
+        return guardian_name in self.completed_trials
+
+    # Snapshots
+
+    def snapshot(self):
+        """Get an immutable copy of the state that can be restored later"""
+        return (
+            self.name, self.motivation, self.aws_knowledge, self.concentration, self.level,
+            tuple(self.items.items()), tuple(self.skills), tuple(self.completed_trials),
+        )
+
+    def restore(self, snapshot):
+        """Restore the state from a snapshot"""
+        (self.name, self.motivation, self.aws_knowledge, self.concentration, self.level,
+         items, skills, completed_trials) = snapshot
+        self.items = Counter(dict(items))
+        self.skills = dict.fromkeys(skills)
+        self.completed_trials = dict.fromkeys(completed_trials)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Create a player from a snapshot"""
+        player = cls.__new__(cls)
+        player.restore(snapshot)
+        return player
+
+    def __repr__(self):
+        return (f"PlayerState(name={self.name!r}, level={self.level}, motivation={self.motivation}, "
+                f"aws_knowledge={self.aws_knowledge}, concentration={self.concentration}, "
+                f"items={dict(self.items)}, skills={list(self.skills)}, "
+                f"completed_trials={list(self.completed_trials)})")
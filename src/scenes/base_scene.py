@@ -6,8 +6,24 @@ Base Scene class that all game scenes inherit from
 """
 
 class BaseScene:
+    # Whether changing to this scene writes the autosave slot
+    autosave = True
+    # Whether the scene paints the whole screen when shown as an overlay,
+    # so the scenes below don't need to be drawn
+    opaque = False
+    
     def __init__(self, scene_manager):
         self.scene_manager = scene_manager
+        # Time source for timers and animations (virtual in headless runs)
+        self.clock = scene_manager.clock
+    
+    def on_enter(self):
+        """Called when the scene becomes the current scene"""
+        pass
+    
+    def on_exit(self):
+        """Called when another scene replaces this one"""
+        pass
     
     def handle_event(self, event):
         """Handle pygame events"""
@@ -20,3 +36,7 @@ class BaseScene:
     def draw(self, screen):
         """Draw scene elements"""
         pass
+    
+    def is_animating(self):
+        """Check if the scene changes without input (timers, blinking, scrolling)"""
+        return False
@@ -8,6 +8,12 @@ Battle Result Scene - Shows the result of a battle
 import pygame
 from src.scenes.base_scene import BaseScene
 from src.ui.button import Button
+from src.ui.input_router import InputRouter
+from src.ui.panel import Panel, get_overlay
+from src.utils.assets import assets
+from src.utils.background import get_gradient_background
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLUE, LIGHT_BLUE, GREEN, RED
 
 class BattleResultScene(BaseScene):
@@ -18,13 +24,12 @@ class BattleResultScene(BaseScene):
         self.result = result  # "victory", "defeat", or "escape"
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', 48)
-            self.text_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 24)
-        except:
-            # フォールバックとしてSysFontを使用
-            self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font(48, bold=True)
+        self.text_font = get_font(24)
+        
+        # Result window
+        self.window = Panel((SCREEN_WIDTH // 6, SCREEN_HEIGHT // 6, 
+                             SCREEN_WIDTH * 2 // 3, SCREEN_HEIGHT * 2 // 3))
         
         # Create continue button
         button_width = 200
@@ -42,55 +47,43 @@ class BattleResultScene(BaseScene):
             action=self.continue_adventure
         )
         
-        # Try to load background image
-        try:
-            self.background = pygame.image.load("src/assets/images/result_bg.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
+        # Load background image on the asset thread; the fallback is drawn until it's ready
+        self.background = assets.load_image("src/assets/images/result_bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Continue with the button or space/enter
+        self.router = InputRouter()
+        self.router.add_button(self.continue_button)
+        self.router.add_key(pygame.K_SPACE, self.continue_adventure)
+        self.router.add_key(pygame.K_RETURN, self.continue_adventure)
     
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check button click
-            self.continue_button.check_click(event.pos)
-        
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                # Continue on space/enter
-                self.continue_adventure()
+        self.router.handle_event(event)
     
     def update(self):
         pass
     
     def draw(self, screen):
         # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        background = self.background.get()
+        if background:
+            screen.blit(background, (0, 0))
         else:
             # Fallback gradient background
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(255 * (1 - y / SCREEN_HEIGHT))
-                blue_value = min(255, color_value * 2)  # 255を超えないようにする
-                pygame.draw.line(screen, (0, color_value, blue_value), (0, y), (SCREEN_WIDTH, y))
+            screen.blit(get_gradient_background((SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
         
         # Draw semi-transparent overlay for text readability
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 150), (0, 0))
         
         # Draw result window
-        result_rect = pygame.Rect(SCREEN_WIDTH // 6, SCREEN_HEIGHT // 6, 
-                               SCREEN_WIDTH * 2 // 3, SCREEN_HEIGHT * 2 // 3)
-        pygame.draw.rect(screen, (50, 50, 80), result_rect, border_radius=10)
-        pygame.draw.rect(screen, WHITE, result_rect, 2, border_radius=10)
+        self.window.draw(screen)
         
         # Draw title based on result
         if self.result == "victory":
-            title_text = self.title_font.render("勝利！", True, GREEN)
+            title_text = render_text(self.title_font, "勝利！", GREEN)
         elif self.result == "defeat":
-            title_text = self.title_font.render("敗北...", True, RED)
+            title_text = render_text(self.title_font, "敗北...", RED)
         else:  # escape
-            title_text = self.title_font.render("逃走成功", True, WHITE)
+            title_text = render_text(self.title_font, "逃走成功", WHITE)
         
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6 + 40))
         screen.blit(title_text, title_rect)
@@ -125,7 +118,7 @@ class BattleResultScene(BaseScene):
             ]
         
         for line in result_lines:
-            text_surface = self.text_font.render(line, True, WHITE)
+            text_surface = render_text(self.text_font, line, WHITE)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
             screen.blit(text_surface, text_rect)
             y_pos += 40
@@ -136,4 +129,4 @@ class BattleResultScene(BaseScene):
     def continue_adventure(self):
         # Return to map scene
         from src.scenes.map_scene import MapScene
-        self.scene_manager.change_scene(MapScene(self.scene_manager))
+        self.scene_manager.show_scene(MapScene)
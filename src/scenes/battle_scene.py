@@ -6,15 +6,22 @@ Battle Scene - Handles battles with AWS Guardians
 """
 
 import pygame
-import random
+from src.engine.battle_engine import BattleEngine
 from src.scenes.base_scene import BaseScene
 from src.scenes.battle_result_scene import BattleResultScene
 from src.ui.button import Button
+from src.ui.input_router import InputRouter
 from src.ui.text_input import TextInput
 from src.ui.status_bar import StatusBar
+from src.ui.panel import Panel
+from src.utils.assets import assets
+from src.utils.background import get_gradient_background
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.catalog import CATALOG
+from src.utils.dirty_rects import mark_all_dirty
 from src.utils.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, RED, GREEN, BLUE, LIGHT_BLUE,
-    SKILLS
+    SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, RED, GREEN, BLUE, LIGHT_BLUE
 )
 
 class BattleScene(BaseScene):
@@ -22,8 +29,9 @@ class BattleScene(BaseScene):
         super().__init__(scene_manager)
         
         self.guardian = guardian
-        self.guardian_hp = guardian["hp"]
-        self.max_guardian_hp = guardian["hp"]
+        
+        # Battle rules are resolved by the engine; this scene only presents them
+        self.engine = BattleEngine(guardian, scene_manager.get_player_data())
         
         # Battle state
         self.battle_state = "intro"  # intro, player_turn, guardian_turn, command_input, result
@@ -37,15 +45,12 @@ class BattleScene(BaseScene):
         self.animation_delay = 2000  # milliseconds
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', 36)
-            self.text_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 24)
-            self.message_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 20)
-        except:
-            # フォールバックとしてSysFontを使用
-            self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
-            self.message_font = pygame.font.SysFont('Arial', 20)
+        self.title_font = get_font(36, bold=True)
+        self.text_font = get_font(24)
+        self.message_font = get_font(20)
+        
+        # Battle message box (opaque, as pygame.draw.rect ignored the old fill's alpha)
+        self.message_box = Panel((50, SCREEN_HEIGHT - 200, SCREEN_WIDTH - 100, 80), fill_color=BLACK)
         
         # Create action buttons
         button_width = 150
@@ -114,7 +119,8 @@ class BattleScene(BaseScene):
             SCREEN_WIDTH // 2,
             40,
             max_length=50,
-            placeholder="AWSコマンドを入力..."
+            placeholder="AWSコマンドを入力...",
+            clock=self.clock
         )
         
         # Create item buttons (shown when item is selected)
@@ -167,8 +173,8 @@ class BattleScene(BaseScene):
             200,
             20,
             "",
-            self.guardian_hp,
-            self.max_guardian_hp,
+            self.engine.guardian_hp,
+            self.engine.max_guardian_hp,
             RED
         )
         
@@ -189,88 +195,46 @@ class BattleScene(BaseScene):
             (100, 255, 100)
         )
         
-        # Try to load background and guardian images
-        try:
-            self.background = pygame.image.load(f"src/assets/images/battle_{guardian['name'].lower()}_bg.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
-        
-        try:
-            self.guardian_image = pygame.image.load(f"src/assets/images/{guardian['name'].lower()}.png")
-            # Scale guardian image to reasonable size
-            max_size = min(SCREEN_WIDTH // 3, SCREEN_HEIGHT // 2)
-            width, height = self.guardian_image.get_size()
-            scale = min(max_size / width, max_size / height)
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            self.guardian_image = pygame.transform.scale(self.guardian_image, (new_width, new_height))
-            self.guardian_image_rect = self.guardian_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        except:
-            self.guardian_image = None
+        # Route input by battle state
+        any_input = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+        self.router = InputRouter()
+        self.router.add_listener(lambda event: self.start_player_turn(), any_input, "intro")
+        self.router.add_buttons([self.attack_button, self.item_button, self.run_button], "player_turn")
+        self.router.add_buttons(self.skill_buttons + [self.back_button], "skill_select")
+        self.router.add_buttons(self.item_buttons + [self.back_button], "item_select")
+        self.router.add_listener(self.command_input.handle_event, any_input, "command_input")
+        self.router.add_buttons([self.submit_button, self.back_button], "command_input")
+        self.router.add_key(pygame.K_RETURN, self.submit_command, "command_input")
+        # Any click or key moves the guardian's turn and the result along
+        self.router.add_listener(lambda event: self.process_guardian_attack(), any_input, "guardian_turn")
+        self.router.add_listener(lambda event: self.show_result(), any_input, "result")
+        
+        # Load background and guardian images on the asset thread (usually prefetched by the map)
+        self.background, self.guardian_image = self.preload_assets(guardian)
+    
+    @staticmethod
+    def preload_assets(guardian):
+        """Start loading the background and guardian image for a battle"""
+        # Scale guardian image to reasonable size
+        max_size = min(SCREEN_WIDTH // 3, SCREEN_HEIGHT // 2)
+        return assets.prefetch([
+            (f"src/assets/images/battle_{guardian['name'].lower()}_bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT), None),
+            (f"src/assets/images/{guardian['name'].lower()}.png", None, max_size),
+        ])
     
     def handle_event(self, event):
-        if self.battle_state == "intro":
-            if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
-                self.battle_state = "player_turn"
-                self.battle_message = "どうする？"
-        
-        elif self.battle_state == "player_turn":
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check button clicks
-                self.attack_button.check_click(event.pos)
-                self.item_button.check_click(event.pos)
-                self.run_button.check_click(event.pos)
-        
-        elif self.battle_state == "skill_select":
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check skill button clicks
-                for button in self.skill_buttons:
-                    button.check_click(event.pos)
-                
-                # Check back button click
-                self.back_button.check_click(event.pos)
-        
-        elif self.battle_state == "item_select":
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check item button clicks
-                for button in self.item_buttons:
-                    button.check_click(event.pos)
-                
-                # Check back button click
-                self.back_button.check_click(event.pos)
-        
-        elif self.battle_state == "command_input":
-            # Handle command input events
-            self.command_input.handle_event(event)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check submit button click
-                self.submit_button.check_click(event.pos)
-                
-                # Check back button click
-                self.back_button.check_click(event.pos)
-            
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                # Submit on enter key
-                self.submit_command()
-        
-        elif self.battle_state == "guardian_turn":
-            if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
-                # Process guardian's attack and go back to player turn
-                self.process_guardian_attack()
-        
-        elif self.battle_state == "result":
-            if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
-                # Show battle result scene
-                self.show_result()
+        self.router.handle_event(event, self.battle_state)
+    
+    def start_player_turn(self):
+        self.battle_state = "player_turn"
+        self.battle_message = "どうする？"
     
     def update(self):
         # Update status bars
         player_data = self.scene_manager.get_player_data()
         self.player_motivation_bar.update_value(player_data["motivation"])
         self.player_concentration_bar.update_value(player_data["concentration"])
-        self.guardian_hp_bar.update_value(self.guardian_hp)
+        self.guardian_hp_bar.update_value(self.engine.guardian_hp)
         
         # Update command input if active
         if self.battle_state == "command_input":
@@ -278,37 +242,42 @@ class BattleScene(BaseScene):
         
         # Handle animation timers
         if self.battle_state in ["guardian_turn", "result"]:
-            now = pygame.time.get_ticks()
+            now = self.clock.get_ticks()
             if now - self.animation_timer > self.animation_delay:
+                mark_all_dirty()
                 if self.battle_state == "guardian_turn":
                     self.battle_state = "player_turn"
                     self.battle_message = "どうする？"
                 elif self.battle_state == "result":
                     self.show_result()
     
+    def is_animating(self):
+        # Turn timers run out on their own and the command input cursor blinks
+        return self.battle_state in ["guardian_turn", "result", "command_input"]
+    
     def draw(self, screen):
         # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        background = self.background.get()
+        if background:
+            screen.blit(background, (0, 0))
         else:
             # Fallback gradient background
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(255 * (1 - y / SCREEN_HEIGHT))
-                blue_value = min(255, color_value * 2)  # 255を超えないようにする
-                pygame.draw.line(screen, (0, color_value, blue_value), (0, y), (SCREEN_WIDTH, y))
+            screen.blit(get_gradient_background((SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
         
         # Draw guardian
-        if self.guardian_image:
-            screen.blit(self.guardian_image, self.guardian_image_rect)
+        guardian_image = self.guardian_image.get()
+        if guardian_image:
+            guardian_image_rect = guardian_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+            screen.blit(guardian_image, guardian_image_rect)
         else:
             # Fallback guardian representation
             pygame.draw.circle(screen, RED, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50), 50)
-            guardian_name = self.text_font.render(self.guardian["name"], True, WHITE)
+            guardian_name = render_text(self.text_font, self.guardian["name"], WHITE)
             guardian_name_rect = guardian_name.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
             screen.blit(guardian_name, guardian_name_rect)
         
         # Draw guardian name and HP bar
-        guardian_name = self.title_font.render(self.guardian["name"], True, WHITE)
+        guardian_name = render_text(self.title_font, self.guardian["name"], WHITE)
         guardian_name_rect = guardian_name.get_rect(center=(SCREEN_WIDTH // 2, 70))
         screen.blit(guardian_name, guardian_name_rect)
         self.guardian_hp_bar.draw(screen)
@@ -319,18 +288,16 @@ class BattleScene(BaseScene):
         
         # Draw player name and level
         player_data = self.scene_manager.get_player_data()
-        player_text = self.text_font.render(f"{player_data['name']} Lv.{player_data['level']}", True, WHITE)
+        player_text = render_text(self.text_font, f"{player_data['name']} Lv.{player_data['level']}", WHITE)
         player_rect = player_text.get_rect(topleft=(20, 80))
         screen.blit(player_text, player_rect)
         
         # Draw battle message box
-        message_box = pygame.Rect(50, SCREEN_HEIGHT - 200, SCREEN_WIDTH - 100, 80)
-        pygame.draw.rect(screen, (0, 0, 0, 180), message_box, border_radius=10)
-        pygame.draw.rect(screen, WHITE, message_box, 2, border_radius=10)
+        self.message_box.draw(screen)
         
         # Draw battle message
-        message_text = self.message_font.render(self.battle_message, True, WHITE)
-        message_rect = message_text.get_rect(center=message_box.center)
+        message_text = render_text(self.message_font, self.battle_message, WHITE)
+        message_rect = message_text.get_rect(center=self.message_box.rect.center)
         screen.blit(message_text, message_rect)
         
         # Draw UI based on battle state
@@ -383,6 +350,7 @@ class BattleScene(BaseScene):
                         action=lambda s=skill_name: self.select_skill(s)
                     )
                     self.skill_buttons.append(skill_button)
+            self.router.set_buttons(self.skill_buttons + [self.back_button], "skill_select")
         
         elif action == "item":
             # Show item selection
@@ -412,6 +380,7 @@ class BattleScene(BaseScene):
                         action=lambda item=item_name: self.use_item(item)
                     )
                     self.item_buttons.append(item_button)
+            self.router.set_buttons(self.item_buttons + [self.back_button], "item_select")
             
             if not player_items:
                 self.battle_message = "アイテムを持っていません"
@@ -419,22 +388,20 @@ class BattleScene(BaseScene):
         
         elif action == "run":
             # Try to run away
-            success = random.random() < 0.5
-            
-            if success:
+            if self.engine.try_escape():
                 self.battle_message = "うまく逃げ出した！"
                 self.battle_state = "result"
-                self.animation_timer = pygame.time.get_ticks()
+                self.animation_timer = self.clock.get_ticks()
             else:
                 self.battle_message = "逃げられなかった！"
                 self.battle_state = "guardian_turn"
-                self.animation_timer = pygame.time.get_ticks()
+                self.animation_timer = self.clock.get_ticks()
     
     def select_skill(self, skill_name):
         self.selected_action = skill_name
         
         # Find skill details
-        skill_details = next((s for s in SKILLS if s["name"] == skill_name), None)
+        skill_details = CATALOG.skill(skill_name)
         
         if skill_details:
             # Show command input for this skill
@@ -452,101 +419,61 @@ class BattleScene(BaseScene):
         if not command:
             return
         
-        # Find skill details
-        skill_details = next((s for s in SKILLS if s["name"] == self.selected_action), None)
+        # Resolve the attack (damage, weakness and critical hits)
+        attack = self.engine.player_attack(self.selected_action, command)
         
-        if not skill_details:
+        if not attack:
             self.battle_state = "player_turn"
             return
         
-        # Calculate damage based on skill power and player level
-        base_damage = skill_details["power"]
-        player_level = self.scene_manager.get_player_data()["level"]
-        damage = base_damage * (1 + (player_level - 1) * 0.2)
-        
-        # Check if command contains keywords related to guardian's weakness
-        if self.guardian["weakness"].lower() in command.lower():
-            damage *= 2
-            critical_hit = True
-        else:
-            critical_hit = random.random() < 0.2
-            if critical_hit:
-                damage *= 1.5
-        
-        # Apply damage
-        damage = int(damage)
-        self.guardian_hp -= damage
-        
         # Update battle message
-        if critical_hit:
-            self.battle_message = f"クリティカルヒット！{self.guardian['name']}に{damage}のダメージ！"
+        if attack.critical:
+            self.battle_message = f"クリティカルヒット！{self.guardian['name']}に{attack.damage}のダメージ！"
         else:
-            self.battle_message = f"{self.guardian['name']}に{damage}のダメージ！"
+            self.battle_message = f"{self.guardian['name']}に{attack.damage}のダメージ！"
         
-        # Check if guardian is defeated
-        if self.guardian_hp <= 0:
-            self.guardian_hp = 0
+        # Check if guardian is defeated (the engine records the cleared trial and reward)
+        if attack.defeated:
             self.battle_message = f"{self.guardian['name']}を倒した！"
             self.battle_state = "result"
-            self.animation_timer = pygame.time.get_ticks()
-            
-            # Mark trial as completed
-            self.scene_manager.complete_trial(self.guardian["name"])
-            
-            # Award AWS knowledge
-            self.scene_manager.update_player_stat("aws_knowledge", 50)
+            self.animation_timer = self.clock.get_ticks()
         else:
             # Guardian's turn
             self.battle_state = "guardian_turn"
-            self.animation_timer = pygame.time.get_ticks()
+            self.animation_timer = self.clock.get_ticks()
     
     def use_item(self, item_name):
-        from src.utils.constants import ITEMS
-        
-        # Find item details
-        item_details = next((item for item in ITEMS if item["name"] == item_name), None)
+        # Apply item effects and remove it from the inventory
+        effects = self.engine.use_item(item_name)
         
-        if not item_details:
+        if effects is None:
             self.battle_message = "そのアイテムは使えません"
             self.battle_state = "player_turn"
             return
         
-        # Apply item effects
-        for stat, value in item_details["effect"].items():
+        for stat, value in effects.items():
             if stat == "damage_reduction":
                 # Special case for damage reduction items
                 self.battle_message = f"{item_name}を使った！次の攻撃のダメージが半減する！"
             else:
-                # Apply stat changes
-                self.scene_manager.update_player_stat(stat, value)
                 self.battle_message = f"{item_name}を使った！{stat}が{value}回復した！"
         
-        # Remove item from inventory
-        self.scene_manager.remove_item(item_name)
-        
         # Guardian's turn
         self.battle_state = "guardian_turn"
-        self.animation_timer = pygame.time.get_ticks()
+        self.animation_timer = self.clock.get_ticks()
     
     def process_guardian_attack(self):
-        # Select random attack pattern
-        attack = random.choice(self.guardian["attack_patterns"])
-        
-        # Calculate damage
-        base_damage = random.randint(10, 20)
-        
-        # Apply damage to player stats
-        self.scene_manager.update_player_stat("motivation", -base_damage)
-        self.scene_manager.update_player_stat("concentration", -base_damage // 2)
+        # Resolve the guardian's attack pattern and damage
+        attack = self.engine.guardian_attack()
         
         # Update battle message
-        self.battle_message = f"{self.guardian['name']}の{attack}！やる気が{base_damage}減少した！"
+        self.battle_message = f"{self.guardian['name']}の{attack.attack}！やる気が{attack.damage}減少した！"
         
         # Check if player is defeated
-        if self.scene_manager.is_game_over():
+        if attack.defeated:
             self.battle_message = "やる気がなくなってしまった..."
             self.battle_state = "result"
-            self.animation_timer = pygame.time.get_ticks()
+            self.animation_timer = self.clock.get_ticks()
         else:
             # Back to player turn
             self.battle_state = "player_turn"
@@ -557,15 +484,7 @@ class BattleScene(BaseScene):
         self.battle_message = "どうする？"
     
     def show_result(self):
-        # Determine battle result
-        if self.guardian_hp <= 0:
-            result = "victory"
-        elif self.scene_manager.is_game_over():
-            result = "defeat"
-        else:
-            result = "escape"
-        
         # Show battle result scene
         self.scene_manager.change_scene(
-            BattleResultScene(self.scene_manager, self.guardian, result)
+            BattleResultScene(self.scene_manager, self.guardian, self.engine.result)
         )
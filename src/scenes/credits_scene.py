@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Credits Scene - Overlay showing the credits on top of the title or ending
+"""
+
+import pygame
+from src.scenes.base_scene import BaseScene
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.constants import SCREEN_WIDTH, WHITE, BLACK
+
+CREDITS_LINES = [
+    "アマゾン・フォレスト・クエスト：秘宝と七つのAWS守護者",
+    "",
+    "開発: Amazon Q CLI チーム",
+    "グラフィック: Pygameとチームメンバー",
+    "音楽: オープンソース素材",
+    "",
+    "このゲームはAWSサービスの学習を目的としています",
+    "",
+    "クリックして戻る"
+]
+
+class CreditsScene(BaseScene):
+    # The covered title or ending text would show through a translucent overlay
+    opaque = True
+    
+    def __init__(self, scene_manager, lines=CREDITS_LINES, title_color=WHITE, line_spacing=40):
+        super().__init__(scene_manager)
+        
+        self.lines = lines
+        self.title_color = title_color
+        self.line_spacing = line_spacing
+        
+        # Load fonts
+        self.title_font = get_font(48, bold=True)
+        self.text_font = get_font(24)
+    
+    def handle_event(self, event):
+        # Any click (or space/enter) returns to the scene below
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.scene_manager.pop_scene()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+                self.scene_manager.pop_scene()
+    
+    def draw(self, screen):
+        # Hide the scene below completely
+        screen.fill(BLACK)
+        
+        # Draw credits title
+        credits_title = render_text(self.title_font, "クレジット", self.title_color)
+        credits_title_rect = credits_title.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        screen.blit(credits_title, credits_title_rect)
+        
+        # Draw credits content
+        y_pos = 180
+        for line in self.lines:
+            credit_text = render_text(self.text_font, line, WHITE)
+            credit_rect = credit_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
+            screen.blit(credit_text, credit_rect)
+            y_pos += self.line_spacing
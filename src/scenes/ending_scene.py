@@ -7,7 +7,15 @@ Ending Scene - Shown when the player completes all trials
 
 import pygame
 from src.scenes.base_scene import BaseScene
+from src.scenes.credits_scene import CreditsScene, CREDITS_LINES
 from src.ui.button import Button
+from src.ui.input_router import InputRouter
+from src.ui.panel import get_overlay
+from src.ui.typewriter_text import TypewriterText
+from src.utils.assets import assets
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.dirty_rects import mark_all_dirty
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLUE, LIGHT_BLUE, YELLOW
 
 class EndingScene(BaseScene):
@@ -15,13 +23,8 @@ class EndingScene(BaseScene):
         super().__init__(scene_manager)
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', 48)
-            self.text_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 24)
-        except:
-            # フォールバックとしてSysFontを使用
-            self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font(48, bold=True)
+        self.text_font = get_font(24)
         
         # Ending text
         self.ending_title = "エピローグ：無限の拡張性"
@@ -40,9 +43,8 @@ class EndingScene(BaseScene):
             "AWSの世界での新たな冒険はこれからも続いていく..."
         ]
         
-        self.current_line = 0
-        self.text_speed = 3  # Characters per frame
-        self.text_progress = 0
+        self.typewriter = TypewriterText(self.ending_text, self.text_font, WHITE, SCREEN_WIDTH // 2, 150, 30,
+                                         clock=self.clock)
         self.text_complete = False
         
         # Create buttons (only shown when text is complete)
@@ -74,184 +76,97 @@ class EndingScene(BaseScene):
             action=self.return_to_title
         )
         
-        # Credits state
-        self.showing_credits = False
+        # Load background image on the asset thread; the fallback is drawn until it's ready
+        self.background = assets.load_image("src/assets/images/ending_bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
         
-        # Try to load background image
-        try:
-            self.background = pygame.image.load("src/assets/images/ending_bg.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
+        # Any click or space/enter skips the text; once it's complete space/enter shows the credits
+        self.router = InputRouter()
+        self.router.add_listener(lambda event: self.skip_text(), (pygame.MOUSEBUTTONDOWN,), "typing")
+        for key in (pygame.K_SPACE, pygame.K_RETURN):
+            self.router.add_key(key, self.skip_text, "typing")
+            self.router.add_key(key, self.show_credits, "complete")
+        self.router.add_buttons([self.credits_button, self.title_button], "complete")
     
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.showing_credits:
-                # Return from credits on click
-                self.showing_credits = False
-                return
-            
-            if self.text_complete:
-                # Check button clicks when text is complete
-                self.credits_button.check_click(event.pos)
-                self.title_button.check_click(event.pos)
-            else:
-                # Skip to end of text on click
-                self.text_complete = True
-                self.current_line = len(self.ending_text)
-                self.text_progress = 0
-        
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                if self.showing_credits:
-                    # Return from credits on space/enter
-                    self.showing_credits = False
-                elif self.text_complete:
-                    # Show credits on space/enter when text is complete
-                    self.show_credits()
-                else:
-                    # Skip to end of text on space/enter
-                    self.text_complete = True
-                    self.current_line = len(self.ending_text)
-                    self.text_progress = 0
+        self.router.handle_event(event, "complete" if self.text_complete else "typing")
     
     def update(self):
+        # The fallback starfield scrolls every frame
+        if not self.background.get():
+            mark_all_dirty()
+        
         # Update text animation
         if not self.text_complete:
-            if self.current_line < len(self.ending_text):
-                current_text = self.ending_text[self.current_line]
-                if self.text_progress < len(current_text):
-                    self.text_progress += self.text_speed
-                    if self.text_progress >= len(current_text):
-                        self.text_progress = 0
-                        self.current_line += 1
-                else:
-                    self.text_progress = 0
-                    self.current_line += 1
-            else:
+            self.typewriter.update()
+            if self.typewriter.complete:
                 self.text_complete = True
+                mark_all_dirty()
+    
+    def skip_text(self):
+        """Show the rest of the text at once"""
+        self.typewriter.skip()
+        self.text_complete = True
+    
+    def is_animating(self):
+        # The fallback starfield scrolls all the time
+        return not self.text_complete or not self.background.get()
     
     def draw(self, screen):
         # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        background = self.background.get()
+        if background:
+            screen.blit(background, (0, 0))
         else:
             # Fallback starry background
             screen.fill((0, 0, 40))
             for i in range(100):
-                x = pygame.time.get_ticks() // 50 + i * 10
+                x = self.clock.get_ticks() // 50 + i * 10
                 y = i * 6
                 pygame.draw.circle(screen, WHITE, (x % SCREEN_WIDTH, y % SCREEN_HEIGHT), 1)
         
-        if self.showing_credits:
-            self.draw_credits(screen)
-        else:
-            # Draw semi-transparent overlay for text readability
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
-            
-            # Draw title
-            title_text = self.title_font.render(self.ending_title, True, YELLOW)
-            title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            screen.blit(title_text, title_rect)
-            
-            # Draw ending text
-            if self.text_complete:
-                # Draw all text at once
-                y_pos = 150
-                for line in self.ending_text:
-                    if line:  # Skip empty lines
-                        text_surface = self.text_font.render(line, True, WHITE)
-                        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                        screen.blit(text_surface, text_rect)
-                    y_pos += 30
-                
-                # Draw buttons
-                self.credits_button.draw(screen)
-                self.title_button.draw(screen)
-            else:
-                # Draw animated text
-                y_pos = 150
-                for i in range(self.current_line):
-                    if i < len(self.ending_text):
-                        line = self.ending_text[i]
-                        if line:  # Skip empty lines
-                            text_surface = self.text_font.render(line, True, WHITE)
-                            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                            screen.blit(text_surface, text_rect)
-                    y_pos += 30
-                
-                # Draw current line being animated
-                if self.current_line < len(self.ending_text):
-                    current_text = self.ending_text[self.current_line][:self.text_progress]
-                    if current_text:
-                        text_surface = self.text_font.render(current_text, True, WHITE)
-                        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                        screen.blit(text_surface, text_rect)
-            
-            # Draw hint text
-            if self.text_complete:
-                hint_text = self.text_font.render("スペースキーまたはクリックでクレジットを見る", True, (200, 200, 200))
-            else:
-                hint_text = self.text_font.render("スペースキーまたはクリックでスキップ", True, (200, 200, 200))
-            
-            hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
-            screen.blit(hint_text, hint_rect)
-    
-    def draw_credits(self, screen):
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        # Draw semi-transparent overlay for text readability
+        screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 150), (0, 0))
+        
+        # Draw title
+        title_text = render_text(self.title_font, self.ending_title, YELLOW)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
+        screen.blit(title_text, title_rect)
+        
+        # Draw ending text
+        self.typewriter.draw(screen)
+        
+        if self.text_complete:
+            # Draw buttons
+            self.credits_button.draw(screen)
+            self.title_button.draw(screen)
         
-        # Draw credits title
-        credits_title = self.title_font.render("クレジット", True, YELLOW)
-        credits_title_rect = credits_title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        screen.blit(credits_title, credits_title_rect)
+        # Draw hint text
+        if self.text_complete:
+            hint_text = render_text(self.text_font, "スペースキーまたはクリックでクレジットを見る", (200, 200, 200))
+        else:
+            hint_text = render_text(self.text_font, "スペースキーまたはクリックでスキップ", (200, 200, 200))
         
-        # Draw player stats
+        hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
+        screen.blit(hint_text, hint_rect)
+    
+    def show_credits(self):
+        # Credits with the player's final stats, shown as an overlay
         player_data = self.scene_manager.get_player_data()
         stats = [
             f"冒険者: {player_data['name']}",
             f"最終レベル: {player_data['level']}",
             f"AWS知識: {player_data['aws_knowledge']}",
-            f"クリア時間: {pygame.time.get_ticks() // 1000}秒",
-            "",
-            "アマゾン・フォレスト・クエスト：秘宝と七つのAWS守護者",
-            "",
-            "開発: Amazon Q CLI チーム",
-            "グラフィック: Pygameとチームメンバー",
-            "音楽: オープンソース素材",
+            f"クリア時間: {self.clock.get_ticks() // 1000}秒",
             "",
-            "このゲームはAWSサービスの学習を目的としています",
-            "",
-            "クリックして戻る"
         ]
-        
-        y_pos = 180
-        for line in stats:
-            credit_text = self.text_font.render(line, True, WHITE)
-            credit_rect = credit_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-            screen.blit(credit_text, credit_rect)
-            y_pos += 30
-    
-    def show_credits(self):
-        self.showing_credits = True
+        self.scene_manager.push_scene(
+            CreditsScene(self.scene_manager, stats + CREDITS_LINES, title_color=YELLOW, line_spacing=30)
+        )
     
     def return_to_title(self):
         # Reset player data
-        self.scene_manager.player_data = {
-            "name": "",
-            "motivation": 100,
-            "aws_knowledge": 0,
-            "concentration": 100,
-            "level": 1,
-            "items": [],
-            "skills": ["基本コマンド"],
-            "completed_trials": [],
-        }
+        self.scene_manager.reset_player()
         
         # Return to title scene
         from src.scenes.title_scene import TitleScene
-        self.scene_manager.change_scene(TitleScene(self.scene_manager))
+        self.scene_manager.show_scene(TitleScene)
@@ -8,20 +8,22 @@ Game Over Scene - Shown when the player loses
 import pygame
 from src.scenes.base_scene import BaseScene
 from src.ui.button import Button
+from src.ui.input_router import InputRouter
+from src.utils.assets import assets
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, BLUE, LIGHT_BLUE
 
 class GameOverScene(BaseScene):
+    # Keep the last save from before the defeat
+    autosave = False
+    
     def __init__(self, scene_manager):
         super().__init__(scene_manager)
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', 72)
-            self.text_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 24)
-        except:
-            # フォールバックとしてSysFontを使用
-            self.title_font = pygame.font.SysFont('Arial', 72, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font(72, bold=True)
+        self.text_font = get_font(24)
         
         # Create buttons
         button_width = 200
@@ -52,37 +54,35 @@ class GameOverScene(BaseScene):
             action=self.quit_game
         )
         
-        # Try to load background image
-        try:
-            self.background = pygame.image.load("src/assets/images/game_over_bg.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
+        # Load background image on the asset thread; the fallback is drawn until it's ready
+        self.background = assets.load_image("src/assets/images/game_over_bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Route clicks and hover to the buttons
+        self.router = InputRouter()
+        self.router.add_buttons([self.restart_button, self.quit_button])
     
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check button clicks
-            self.restart_button.check_click(event.pos)
-            self.quit_button.check_click(event.pos)
+        self.router.handle_event(event)
     
     def update(self):
         pass
     
     def draw(self, screen):
         # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        background = self.background.get()
+        if background:
+            screen.blit(background, (0, 0))
         else:
             # Fallback dark background
             screen.fill((20, 20, 40))
         
         # Draw game over text
-        game_over_text = self.title_font.render("GAME OVER", True, RED)
+        game_over_text = render_text(self.title_font, "GAME OVER", RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         screen.blit(game_over_text, game_over_rect)
         
         # Draw message
-        message_text = self.text_font.render("やる気が尽きてしまった...", True, WHITE)
+        message_text = render_text(self.text_font, "やる気が尽きてしまった...", WHITE)
         message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(message_text, message_rect)
         
@@ -91,23 +91,13 @@ class GameOverScene(BaseScene):
         self.quit_button.draw(screen)
     
     def restart_game(self):
-        # Reset player data
-        self.scene_manager.player_data = {
-            "name": self.scene_manager.player_data["name"],  # Keep the name
-            "motivation": 100,
-            "aws_knowledge": 0,
-            "concentration": 100,
-            "level": 1,
-            "items": [],
-            "skills": ["基本コマンド"],
-            "completed_trials": [],
-        }
+        # Reset player data, keeping the name
+        self.scene_manager.reset_player(self.scene_manager.player_data.name)
         
         # Return to title scene
         from src.scenes.title_scene import TitleScene
-        self.scene_manager.change_scene(TitleScene(self.scene_manager))
+        self.scene_manager.show_scene(TitleScene)
     
     def quit_game(self):
-        pygame.quit()
-        import sys
-        sys.exit()
+        # Let the main loop shut down (and write the profiler report) like closing the window
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
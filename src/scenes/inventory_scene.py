@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Inventory Scene - Overlay listing the player's items on top of the map
+"""
+
+import pygame
+from src.scenes.base_scene import BaseScene
+from src.ui.panel import Panel, get_overlay
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.catalog import CATALOG
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
+
+class InventoryScene(BaseScene):
+    def __init__(self, scene_manager):
+        super().__init__(scene_manager)
+        
+        # Load fonts
+        self.title_font = get_font(36, bold=True)
+        self.text_font = get_font(22)
+        
+        self.inventory_rect = pygame.Rect(SCREEN_WIDTH // 4, SCREEN_HEIGHT // 4, 
+                                          SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.window = Panel(self.inventory_rect)
+    
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Close inventory on click outside
+            if not self.inventory_rect.collidepoint(event.pos):
+                self.scene_manager.pop_scene()
+    
+    def draw(self, screen):
+        # Draw semi-transparent overlay
+        screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 200), (0, 0))
+        
+        # Draw inventory window
+        self.window.draw(screen)
+        
+        # Draw inventory title
+        inv_title = render_text(self.title_font, "インベントリ", WHITE)
+        inv_title_rect = inv_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + 30))
+        screen.blit(inv_title, inv_title_rect)
+        
+        # Draw items
+        player_items = self.scene_manager.get_player_data()["items"]
+        if player_items:
+            y_pos = SCREEN_HEIGHT // 4 + 80
+            for item_name in player_items:
+                # Find item details
+                item_details = CATALOG.item(item_name)
+                if item_details:
+                    item_text = render_text(self.text_font, f"{item_name}: {item_details['description']}", WHITE)
+                    item_rect = item_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
+                    screen.blit(item_text, item_rect)
+                    y_pos += 40
+        else:
+            no_items_text = render_text(self.text_font, "アイテムを持っていません", WHITE)
+            no_items_rect = no_items_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            screen.blit(no_items_text, no_items_rect)
+        
+        # Draw close hint
+        close_text = render_text(self.text_font, "クリックして閉じる", (200, 200, 200))
+        close_rect = close_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + SCREEN_HEIGHT // 2 - 30))
+        screen.blit(close_text, close_rect)
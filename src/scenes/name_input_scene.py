@@ -9,21 +9,23 @@ import pygame
 from src.scenes.base_scene import BaseScene
 from src.scenes.prologue_scene import PrologueScene
 from src.ui.button import Button
+from src.ui.input_router import InputRouter
 from src.ui.text_input import TextInput
+from src.utils.assets import assets
+from src.utils.background import get_gradient_background
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLUE, LIGHT_BLUE
 
 class NameInputScene(BaseScene):
+    autosave = False
+    
     def __init__(self, scene_manager):
         super().__init__(scene_manager)
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', 36)
-            self.text_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 24)
-        except:
-            # フォールバックとしてSysFontを使用
-            self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font(36, bold=True)
+        self.text_font = get_font(24)
         
         # Create text input
         input_width = 300
@@ -37,7 +39,8 @@ class NameInputScene(BaseScene):
             input_width,
             input_height,
             max_length=15,
-            placeholder="名前を入力してください"
+            placeholder="名前を入力してください",
+            clock=self.clock
         )
         
         # Create buttons
@@ -71,44 +74,36 @@ class NameInputScene(BaseScene):
         self.error_message = ""
         self.show_error = False
         
-        # Try to load background image
-        try:
-            self.background = pygame.image.load("src/assets/images/name_input_bg.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
+        # Load background image on the asset thread; the fallback is drawn until it's ready
+        self.background = assets.load_image("src/assets/images/name_input_bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Route input to the text field and the buttons
+        self.router = InputRouter()
+        self.router.add_listener(self.name_input.handle_event, (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+        self.router.add_buttons([self.confirm_button, self.back_button])
     
     def handle_event(self, event):
-        # Handle text input events
-        self.name_input.handle_event(event)
-        
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check button clicks
-            self.confirm_button.check_click(event.pos)
-            self.back_button.check_click(event.pos)
-        
-        elif event.type == pygame.MOUSEMOTION:
-            # Check button hover
-            self.confirm_button.check_hover(event.pos)
-            self.back_button.check_hover(event.pos)
+        self.router.handle_event(event)
     
     def update(self):
         # Update text input
         self.name_input.update()
     
+    def is_animating(self):
+        # The cursor blinks while the input is active
+        return self.name_input.active
+    
     def draw(self, screen):
         # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        background = self.background.get()
+        if background:
+            screen.blit(background, (0, 0))
         else:
             # Fallback gradient background
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(255 * (1 - y / SCREEN_HEIGHT))
-                blue_value = min(255, color_value * 2)  # 255を超えないようにする
-                pygame.draw.line(screen, (0, color_value, blue_value), (0, y), (SCREEN_WIDTH, y))
+            screen.blit(get_gradient_background((SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
         
         # Draw title
-        title_text = self.title_font.render("冒険者の名前を入力してください", True, WHITE)
+        title_text = render_text(self.title_font, "冒険者の名前を入力してください", WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         screen.blit(title_text, title_rect)
         
@@ -121,7 +116,7 @@ class NameInputScene(BaseScene):
         
         # Draw error message if needed
         if self.show_error:
-            error_text = self.text_font.render(self.error_message, True, (255, 100, 100))
+            error_text = render_text(self.text_font, self.error_message, (255, 100, 100))
             error_rect = error_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
             screen.blit(error_text, error_rect)
     
@@ -140,4 +135,4 @@ class NameInputScene(BaseScene):
     def go_back(self):
         # Import here to avoid circular import
         from src.scenes.title_scene import TitleScene
-        self.scene_manager.change_scene(TitleScene(self.scene_manager))
+        self.scene_manager.show_scene(TitleScene)
@@ -9,6 +9,14 @@ import pygame
 from src.scenes.base_scene import BaseScene
 from src.scenes.map_scene import MapScene
 from src.ui.button import Button
+from src.ui.input_router import InputRouter
+from src.ui.panel import get_overlay
+from src.ui.typewriter_text import TypewriterText
+from src.utils.assets import assets
+from src.utils.background import get_gradient_background
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.dirty_rects import mark_all_dirty
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLUE, LIGHT_BLUE
 
 class PrologueScene(BaseScene):
@@ -16,13 +24,8 @@ class PrologueScene(BaseScene):
         super().__init__(scene_manager)
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', 36)
-            self.text_font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 22)
-        except:
-            # フォールバックとしてSysFontを使用
-            self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-            self.text_font = pygame.font.SysFont('Arial', 22)
+        self.title_font = get_font(36, bold=True)
+        self.text_font = get_font(22)
         
         # Prologue text
         self.prologue_title = "プロローグ：アマゾンの森の伝説"
@@ -41,9 +44,8 @@ class PrologueScene(BaseScene):
             "あなたの冒険が今、始まる..."
         ]
         
-        self.current_line = 0
-        self.text_speed = 3  # Characters per frame
-        self.text_progress = 0
+        self.typewriter = TypewriterText(self.prologue_text, self.text_font, WHITE, SCREEN_WIDTH // 2, 150, 30,
+                                         clock=self.clock)
         self.text_complete = False
         
         # Create button (only shown when text is complete)
@@ -62,114 +64,73 @@ class PrologueScene(BaseScene):
             action=self.start_adventure
         )
         
-        # Try to load background image
-        try:
-            self.background = pygame.image.load("src/assets/images/prologue_bg.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.background = None
+        # Load background image on the asset thread; the fallback is drawn until it's ready
+        self.background = assets.load_image("src/assets/images/prologue_bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Any click or space/enter skips the text; once it's complete they start the adventure
+        self.router = InputRouter()
+        self.router.add_listener(lambda event: self.skip_text(), (pygame.MOUSEBUTTONDOWN,), "typing")
+        for key in (pygame.K_SPACE, pygame.K_RETURN):
+            self.router.add_key(key, self.skip_text, "typing")
+            self.router.add_key(key, self.start_adventure, "complete")
+        self.router.add_button(self.continue_button, "complete")
+    
+    def on_exit(self):
+        # The scene is pooled; drop the hover highlight until the next visit
+        self.router.clear_hover()
     
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.text_complete:
-                # Check button click when text is complete
-                self.continue_button.check_click(event.pos)
-            else:
-                # Skip to end of text on click
-                self.text_complete = True
-                self.current_line = len(self.prologue_text)
-                self.text_progress = 0
-        
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                if self.text_complete:
-                    # Start adventure on space/enter when text is complete
-                    self.start_adventure()
-                else:
-                    # Skip to end of text on space/enter
-                    self.text_complete = True
-                    self.current_line = len(self.prologue_text)
-                    self.text_progress = 0
+        self.router.handle_event(event, "complete" if self.text_complete else "typing")
     
     def update(self):
         # Update text animation
         if not self.text_complete:
-            if self.current_line < len(self.prologue_text):
-                current_text = self.prologue_text[self.current_line]
-                if self.text_progress < len(current_text):
-                    self.text_progress += self.text_speed
-                    if self.text_progress >= len(current_text):
-                        self.text_progress = 0
-                        self.current_line += 1
-                else:
-                    self.text_progress = 0
-                    self.current_line += 1
-            else:
+            self.typewriter.update()
+            if self.typewriter.complete:
                 self.text_complete = True
+                mark_all_dirty()
+    
+    def skip_text(self):
+        """Show the rest of the text at once"""
+        self.typewriter.skip()
+        self.text_complete = True
+    
+    def is_animating(self):
+        return not self.text_complete
     
     def draw(self, screen):
         # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        background = self.background.get()
+        if background:
+            screen.blit(background, (0, 0))
         else:
             # Fallback gradient background
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(255 * (1 - y / SCREEN_HEIGHT))
-                blue_value = min(255, color_value * 2)  # 255を超えないようにする
-                pygame.draw.line(screen, (0, color_value, blue_value), (0, y), (SCREEN_WIDTH, y))
+            screen.blit(get_gradient_background((SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
         
         # Draw semi-transparent overlay for text readability
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 150), (0, 0))
         
         # Draw title
-        title_text = self.title_font.render(self.prologue_title, True, WHITE)
+        title_text = render_text(self.title_font, self.prologue_title, WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
         screen.blit(title_text, title_rect)
         
         # Draw prologue text
+        self.typewriter.draw(screen)
+        
         if self.text_complete:
-            # Draw all text at once
-            y_pos = 150
-            for line in self.prologue_text:
-                if line:  # Skip empty lines
-                    text_surface = self.text_font.render(line, True, WHITE)
-                    text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                    screen.blit(text_surface, text_rect)
-                y_pos += 30
-            
             # Draw continue button
             self.continue_button.draw(screen)
-        else:
-            # Draw animated text
-            y_pos = 150
-            for i in range(self.current_line):
-                if i < len(self.prologue_text):
-                    line = self.prologue_text[i]
-                    if line:  # Skip empty lines
-                        text_surface = self.text_font.render(line, True, WHITE)
-                        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                        screen.blit(text_surface, text_rect)
-                y_pos += 30
-            
-            # Draw current line being animated
-            if self.current_line < len(self.prologue_text):
-                current_text = self.prologue_text[self.current_line][:self.text_progress]
-                if current_text:
-                    text_surface = self.text_font.render(current_text, True, WHITE)
-                    text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                    screen.blit(text_surface, text_rect)
         
         # Draw hint text
         if self.text_complete:
-            hint_text = self.text_font.render("スペースキーまたはクリックで続ける", True, (200, 200, 200))
+            hint_text = render_text(self.text_font, "スペースキーまたはクリックで続ける", (200, 200, 200))
         else:
-            hint_text = self.text_font.render("スペースキーまたはクリックでスキップ", True, (200, 200, 200))
+            hint_text = render_text(self.text_font, "スペースキーまたはクリックでスキップ", (200, 200, 200))
         
         hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
         screen.blit(hint_text, hint_rect)
     
     def start_adventure(self):
         # Change to map scene to start the adventure
-        self.scene_manager.change_scene(MapScene(self.scene_manager))
+        self.scene_manager.show_scene(MapScene)
@@ -5,38 +5,176 @@
 Scene Manager for handling different game scenes
 """
 
+import pygame
+from src.engine.battle_engine import apply_stat_change
+from src.entities.player_state import PlayerState
+from src.utils.catalog import CATALOG
+from src.utils.dirty_rects import mark_all_dirty
+from src.utils.event_pump import InputSnapshot
+from src.utils.game_clock import default_clock
+from src.utils.save_game import save_writer, read_save
+
 class SceneManager:
-    def __init__(self):
+    def __init__(self, clock=None):
         self.current_scene = None
-        self.player_data = {
-            "name": "",
-            "motivation": 100,
-            "aws_knowledge": 0,
-            "concentration": 100,
-            "level": 1,
-            "items": [],
-            "skills": ["基本コマンド"],
-            "completed_trials": [],
-        }
+        # The game clock every scene reads its time from
+        self.clock = clock or default_clock
+        
+        # Save slot written on every scene change, or None to not autosave
+        self.autosave_slot = None
+        self.player_data = PlayerState()
+        
+        # Long-lived scenes, reused instead of rebuilt on every visit
+        self.scene_pool = {}
+        
+        # Overlay scenes shown on top of the current scene (inventory, credits, ...)
+        self.overlays = []
+        # Everything below the top overlay, rendered once while it is covered
+        self.covered_snapshot = None
+        
+        # Input of the current logic step, for scenes that poll the mouse or keys
+        self.input = InputSnapshot([])
     
     def change_scene(self, scene):
         """Change to a new scene"""
+        while self.overlays:
+            self.overlays.pop().on_exit()
+        self.covered_snapshot = None
+        
+        if self.current_scene and self.current_scene is not scene:
+            self.current_scene.on_exit()
         self.current_scene = scene
+        scene.on_enter()
+        mark_all_dirty()
+        
+        # A defeated player is never saved, so the slot keeps the last playable state
+        if self.autosave_slot is not None and scene.autosave and not self.is_game_over():
+            self.save_game(self.autosave_slot)
+    
+    def push_scene(self, scene):
+        """Show an overlay scene on top; the scenes below stop updating"""
+        self.overlays.append(scene)
+        self.covered_snapshot = None
+        scene.on_enter()
+        mark_all_dirty()
+    
+    def pop_scene(self):
+        """Close the top overlay scene"""
+        if self.overlays:
+            self.overlays.pop().on_exit()
+            self.covered_snapshot = None
+            mark_all_dirty()
+    
+    def get_active_scene(self):
+        """Get the scene receiving input: the top overlay, or the current scene"""
+        if self.overlays:
+            return self.overlays[-1]
+        return self.current_scene
+    
+    def get_scene(self, scene_class):
+        """Get the pooled instance of a scene class, creating it on first use"""
+        scene = self.scene_pool.get(scene_class)
+        if scene is None:
+            scene = scene_class(self)
+            self.scene_pool[scene_class] = scene
+        return scene
+    
+    def show_scene(self, scene_class):
+        """Change to the pooled instance of a scene class"""
+        self.change_scene(self.get_scene(scene_class))
     
     def handle_event(self, event):
-        """Pass events to the current scene"""
-        if self.current_scene:
-            self.current_scene.handle_event(event)
+        """Pass events to the active scene"""
+        scene = self.get_active_scene()
+        if scene:
+            scene.handle_event(event)
+            
+            # Clicks and key presses can change anything on screen;
+            # mouse motion only changes hover state, which buttons report themselves
+            if event.type != pygame.MOUSEMOTION:
+                mark_all_dirty()
+    
+    def handle_events(self, events):
+        """Pass a frame's events to the active scene, marking the screen dirty once"""
+        redraw = False
+        for event in events:
+            # A click can change scenes, so the receiver is looked up for every event
+            scene = self.get_active_scene()
+            if scene:
+                scene.handle_event(event)
+                redraw = redraw or event.type != pygame.MOUSEMOTION
+        
+        # Same rule as handle_event: hover changes are reported by the buttons
+        if redraw:
+            mark_all_dirty()
+    
+    def handle_input(self, snapshot):
+        """Make a step's input snapshot current and pass its events to the active scene"""
+        self.input = snapshot
+        self.handle_events(snapshot.events)
     
     def update(self):
-        """Update the current scene"""
-        if self.current_scene:
-            self.current_scene.update()
+        """Update the active scene (covered scenes are suspended)"""
+        scene = self.get_active_scene()
+        if scene:
+            scene.update()
     
     def draw(self, screen):
-        """Draw the current scene"""
+        """Draw the current scene and any overlays"""
+        if not self.overlays:
+            if self.current_scene:
+                self.current_scene.draw(screen)
+            return
+        
+        # An opaque overlay hides everything below it
+        if self.overlays[-1].opaque:
+            self.overlays[-1].draw(screen)
+            return
+        
+        # Covered scenes are rendered once and then reused as a single blit
+        if self.covered_snapshot is None:
+            self.covered_snapshot = self.render_covered_scenes(screen)
+        screen.blit(self.covered_snapshot, (0, 0))
+        self.overlays[-1].draw(screen)
+    
+    def render_covered_scenes(self, screen):
+        """Render every scene below the top overlay into a new Surface"""
+        snapshot = pygame.Surface(screen.get_size())
+        if pygame.display.get_surface() is not None:
+            snapshot = snapshot.convert()
+        
         if self.current_scene:
-            self.current_scene.draw(screen)
+            self.current_scene.draw(snapshot)
+        for overlay in self.overlays[:-1]:
+            overlay.draw(snapshot)
+        return snapshot
+    
+    def is_animating(self):
+        """Check if the active scene needs frames without input"""
+        scene = self.get_active_scene()
+        if scene:
+            return scene.is_animating()
+        return False
+    
+    def save_game(self, slot):
+        """Save the player and the current scene in the background"""
+        scene_name = type(self.current_scene).__name__ if self.current_scene else ""
+        return save_writer.save(slot, scene_name, self.player_data.snapshot())
+    
+    def load_game(self, slot):
+        """Restore a save slot and go to the scene it was saved in. Returns False if the slot is empty."""
+        save = read_save(slot)
+        if save is None:
+            return False
+        scene_name, snapshot = save
+        self.player_data = PlayerState.from_snapshot(snapshot)
+        
+        # Scenes that need more than the player state (battles, events) resume on the map
+        from src.scenes.map_scene import MapScene
+        from src.scenes.prologue_scene import PrologueScene
+        resumable = {"MapScene": MapScene, "PrologueScene": PrologueScene}
+        self.show_scene(resumable.get(scene_name, MapScene))
+        return True
     
     def get_player_data(self):
         """Get the player data"""
@@ -44,53 +182,36 @@ class SceneManager:
     
     def set_player_name(self, name):
         """Set the player name"""
-        self.player_data["name"] = name
+        self.player_data.name = name
+    
+    def reset_player(self, name=""):
+        """Start over with fresh player data"""
+        self.player_data = PlayerState(name)
     
     def update_player_stat(self, stat, value):
-        """Update a player stat"""
-        if stat in self.player_data:
-            self.player_data[stat] += value
-            
-            # Ensure stats don't go below 0
-            if self.player_data[stat] < 0:
-                self.player_data[stat] = 0
-                
-            # Check for level up based on AWS knowledge
-            if stat == "aws_knowledge":
-                new_level = 1 + (self.player_data["aws_knowledge"] // 100)
-                if new_level > self.player_data["level"]:
-                    self.player_data["level"] = new_level
-                    return True  # Indicates level up
-        
-        return False
+        """Update a player stat. Returns True on level up."""
+        return apply_stat_change(self.player_data, stat, value)
     
     def add_item(self, item_name):
         """Add an item to the player's inventory"""
-        self.player_data["items"].append(item_name)
+        self.player_data.add_item(item_name)
     
     def remove_item(self, item_name):
         """Remove an item from the player's inventory"""
-        if item_name in self.player_data["items"]:
-            self.player_data["items"].remove(item_name)
-            return True
-        return False
+        return self.player_data.remove_item(item_name)
     
     def add_skill(self, skill_name):
         """Add a skill to the player's skills"""
-        if skill_name not in self.player_data["skills"]:
-            self.player_data["skills"].append(skill_name)
+        self.player_data.add_skill(skill_name)
     
     def complete_trial(self, guardian_name):
         """Mark a trial as completed"""
-        if guardian_name not in self.player_data["completed_trials"]:
-            self.player_data["completed_trials"].append(guardian_name)
+        self.player_data.complete_trial(guardian_name)
     
     def is_game_over(self):
         """Check if the game is over (motivation = 0)"""
-        return self.player_data["motivation"] <= 0
+        return self.player_data.motivation <= 0
     
     def is_game_completed(self):
         """Check if all trials are completed"""
-        from src.utils.constants import AWS_GUARDIANS
-        all_guardians = [guardian["name"] for guardian in AWS_GUARDIANS]
-        return all(guardian in self.player_data["completed_trials"] for guardian in all_guardians)
+        return self.player_data.completed_trials.keys() >= CATALOG.guardian_names
@@ -6,6 +6,9 @@ Button UI element for the game
 """
 
 import pygame
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.dirty_rects import mark_dirty
 from src.utils.constants import WHITE
 
 class Button:
@@ -15,14 +18,11 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.action = action
-        try:
-            self.font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', font_size)
-        except:
-            self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = get_font(font_size)
         self.is_hovered = False
         
         # Pre-render text
-        self.text_surface = self.font.render(self.text, True, WHITE)
+        self.text_surface = render_text(self.font, self.text, WHITE)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
     
     def draw(self, surface):
@@ -38,9 +38,15 @@ class Button:
     
     def check_hover(self, pos):
         """Check if mouse is hovering over button"""
-        self.is_hovered = self.rect.collidepoint(pos)
+        self.set_hover(self.rect.collidepoint(pos))
         return self.is_hovered
     
+    def set_hover(self, hovered):
+        """Show or clear the hover highlight"""
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            mark_dirty(self.rect)
+    
     def check_click(self, pos):
         """Check if button was clicked and execute action if so"""
         if self.rect.collidepoint(pos) and self.action:
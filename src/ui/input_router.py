@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Input router - Sends events to the widgets registered for a scene state
+
+Scenes register buttons, key actions and listeners per state once, instead
+of walking if/elif chains and polling every button on every event. Button
+hit rects go into a coarse grid per state, so a click or mouse move only
+tests the buttons in its cell. Hover is tracked for every registered button.
+"""
+
+import pygame
+from src.utils.assets import ASSET_LOADED
+
+# Size of a hit-test grid cell in pixels
+GRID_CELL_SIZE = 100
+
+# The only event types the game reacts to (TEXTINPUT fills in KEYDOWN's unicode)
+GAME_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,
+    ASSET_LOADED,
+]
+
+
+def allow_game_events():
+    """Keep every other event type (joystick, window, ...) off the queue"""
+    # set_blocked(None) blocks every event type (set_allowed(None) would allow them all)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(GAME_EVENTS)
+
+
+class InputRouter:
+    def __init__(self):
+        # State -> {grid cell: buttons overlapping it}
+        self.grids = {}
+        # (state, key) -> action; key None means any key
+        self.key_actions = {}
+        # (state, event type) -> handlers that see every event of that type first
+        self.listeners = {}
+
+        self.hovered = None
+        self.state = None
+
+        self.dispatch = {
+            pygame.MOUSEBUTTONDOWN: self._mouse_down,
+            pygame.MOUSEMOTION: self._mouse_motion,
+            pygame.KEYDOWN: self._key_down,
+        }
+
+    def add_button(self, button, state=None):
+        """Route clicks and hover inside the button's rect to it while in the state"""
+        grid = self.grids.setdefault(state, {})
+        for cell in self._cells(button.rect):
+            grid.setdefault(cell, []).append(button)
+
+    def add_buttons(self, buttons, state=None):
+        for button in buttons:
+            self.add_button(button, state)
+
+    def set_buttons(self, buttons, state=None):
+        """Replace the buttons of a state (for menus that are rebuilt)"""
+        grid = self.grids.get(state, {})
+        if self.hovered is not None and any(self.hovered in cell for cell in grid.values()):
+            self._set_hovered(None)
+        self.grids[state] = {}
+        self.add_buttons(buttons, state)
+
+    def add_key(self, key, action, state=None):
+        """Call action when the key (or any key, for None) is pressed in the state"""
+        self.key_actions[(state, key)] = action
+
+    def add_listener(self, handler, event_types, state=None):
+        """Pass every event of these types to handler(event) before the buttons and keys"""
+        for event_type in event_types:
+            self.listeners.setdefault((state, event_type), []).append(handler)
+
+    def handle_event(self, event, state=None):
+        """Route an event for the given state. Returns True if something reacted to it."""
+        if state != self.state:
+            self.state = state
+            self._set_hovered(None)
+
+        handled = False
+        for handler in self.listeners.get((state, event.type), ()):
+            handler(event)
+            handled = True
+
+        route = self.dispatch.get(event.type)
+        if route:
+            handled = route(event, state) or handled
+        return handled
+
+    def clear_hover(self):
+        """Drop the hover highlight (when the scene is left)"""
+        self._set_hovered(None)
+
+    def button_at(self, pos, state=None):
+        """Get the button under pos in the state, or None"""
+        grid = self.grids.get(state)
+        if not grid:
+            return None
+        for button in grid.get((pos[0] // GRID_CELL_SIZE, pos[1] // GRID_CELL_SIZE), ()):
+            if button.rect.collidepoint(pos):
+                return button
+        return None
+
+    def _mouse_down(self, event, state):
+        button = self.button_at(event.pos, state)
+        return button is not None and button.check_click(event.pos)
+
+    def _mouse_motion(self, event, state):
+        self._set_hovered(self.button_at(event.pos, state))
+        return self.hovered is not None
+
+    def _key_down(self, event, state):
+        action = self.key_actions.get((state, event.key)) or self.key_actions.get((state, None))
+        if action:
+            action()
+            return True
+        return False
+
+    def _set_hovered(self, button):
+        if button is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.set_hover(False)
+        if button is not None:
+            button.set_hover(True)
+        self.hovered = button
+
+    @staticmethod
+    def _cells(rect):
+        for cell_x in range(rect.left // GRID_CELL_SIZE, (rect.right - 1) // GRID_CELL_SIZE + 1):
+            for cell_y in range(rect.top // GRID_CELL_SIZE, (rect.bottom - 1) // GRID_CELL_SIZE + 1):
+                yield cell_x, cell_y
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Panel UI element - Translucent overlays and bordered windows composed once and reused
+
+Dialog scenes dim the screen and draw a rounded window on top every frame.
+Both layers are static, so they are built once per size and style and each
+frame is a single blit.
+"""
+
+import pygame
+from src.utils.constants import WHITE, BLACK
+
+# Window colors shared by the dialog scenes
+PANEL_COLOR = (50, 50, 80)
+PANEL_RADIUS = 10
+PANEL_BORDER_WIDTH = 2
+
+# (size, color, alpha) -> Surface
+_overlay_cache = {}
+# (size, fill_color, border_color, border_width, radius) -> Surface
+_panel_cache = {}
+
+
+def get_overlay(size, alpha, color=BLACK):
+    """Get the cached translucent overlay for the given size, alpha and color"""
+    key = (tuple(size), tuple(color), alpha)
+    surface = _overlay_cache.get(key)
+    if surface is None:
+        # A uniform color only needs surface alpha, which blits faster than per-pixel alpha
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(color)
+        surface.set_alpha(alpha)
+        _overlay_cache[key] = surface
+    return surface
+
+
+def get_panel_surface(size, fill_color=PANEL_COLOR, border_color=WHITE,
+                      border_width=PANEL_BORDER_WIDTH, radius=PANEL_RADIUS):
+    """Get the cached rounded window with its border for the given size and style"""
+    key = (tuple(size), tuple(fill_color), tuple(border_color), border_width, radius)
+    surface = _panel_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, fill_color, rect, border_radius=radius)
+        if border_width:
+            pygame.draw.rect(surface, border_color, rect, border_width, border_radius=radius)
+
+        # The corners stay transparent, so keep per-pixel alpha
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _panel_cache[key] = surface
+    return surface
+
+
+def clear_panel_cache():
+    """Drop all cached overlays and panels (e.g. after a resolution change)"""
+    _overlay_cache.clear()
+    _panel_cache.clear()
+
+
+class Panel:
+    def __init__(self, rect, fill_color=PANEL_COLOR, border_color=WHITE,
+                 border_width=PANEL_BORDER_WIDTH, radius=PANEL_RADIUS):
+        self.rect = pygame.Rect(rect)
+        self.fill_color = fill_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.radius = radius
+
+    def draw(self, surface):
+        panel = get_panel_surface(self.rect.size, self.fill_color, self.border_color,
+                                  self.border_width, self.radius)
+        surface.blit(panel, self.rect)
@@ -6,6 +6,9 @@ Status Bar UI element for the game
 """
 
 import pygame
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.dirty_rects import mark_dirty
 from src.utils.constants import WHITE, BLACK, GRAY
 
 class StatusBar:
@@ -15,18 +18,17 @@ class StatusBar:
         self.value = value
         self.max_value = max_value
         self.color = color
-        try:
-            self.font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', 16)
-        except:
-            self.font = pygame.font.SysFont('Arial', 16)
+        self.font = get_font(16)
         
         # Pre-render label
-        self.label_surface = self.font.render(self.label, True, WHITE)
+        self.label_surface = render_text(self.font, self.label, WHITE)
         self.label_rect = self.label_surface.get_rect(midright=(self.rect.x - 10, self.rect.centery))
     
     def update_value(self, value):
         """Update the current value"""
-        self.value = value
+        if value != self.value:
+            self.value = value
+            mark_dirty(self.rect)
     
     def draw(self, surface):
         # Draw label
@@ -48,6 +50,6 @@ class StatusBar:
         
         # Draw value text
         value_text = f"{self.value}/{self.max_value}"
-        value_surface = self.font.render(value_text, True, WHITE)
+        value_surface = render_text(self.font, value_text, WHITE)
         value_rect = value_surface.get_rect(center=self.rect.center)
         surface.blit(value_surface, value_rect)
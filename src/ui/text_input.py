@@ -6,25 +6,27 @@ Text Input UI element for the game
 """
 
 import pygame
+from src.utils.fonts import get_font
+from src.utils.text_cache import render_text
+from src.utils.dirty_rects import mark_dirty
+from src.utils.game_clock import default_clock
 from src.utils.constants import WHITE, BLACK, GRAY
 
 class TextInput:
-    def __init__(self, x, y, width, height, max_length=20, placeholder="", font_size=24):
+    def __init__(self, x, y, width, height, max_length=20, placeholder="", font_size=24, clock=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = ""
         self.max_length = max_length
         self.placeholder = placeholder
-        try:
-            self.font = pygame.font.Font('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc', font_size)
-        except:
-            self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = get_font(font_size)
         self.active = False
         self.cursor_visible = True
         self.cursor_timer = 0
         self.cursor_blink_speed = 500  # milliseconds
+        self.clock = clock or default_clock
         
         # Pre-render placeholder text
-        self.placeholder_surface = self.font.render(self.placeholder, True, GRAY)
+        self.placeholder_surface = render_text(self.font, self.placeholder, GRAY)
         self.placeholder_rect = self.placeholder_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
     
     def handle_event(self, event):
@@ -47,10 +49,12 @@ class TextInput:
     
     def update(self):
         # Update cursor blink
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
         if now - self.cursor_timer > self.cursor_blink_speed:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = now
+            if self.active:
+                mark_dirty(self.rect)
     
     def draw(self, surface):
         # Draw input box
@@ -60,7 +64,7 @@ class TextInput:
         
         # Draw text or placeholder
         if self.text:
-            text_surface = self.font.render(self.text, True, WHITE)
+            text_surface = render_text(self.font, self.text, WHITE)
             text_rect = text_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
             surface.blit(text_surface, text_rect)
             
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Asset manager - Decodes and scales images on a worker thread
+
+Scenes get an ImageHandle right away and draw their fallback until
+handle.get() returns the image, so loading never blocks a scene change.
+Finished images are converted once and kept in the shared image cache, so
+coming back to a scene doesn't touch the disk again.
+Handles don't hold on to their image: they look it up in the cache on every
+get(), so the cache's byte budget bounds what stays in memory, and an image
+that was evicted is simply loaded again.
+An ASSET_LOADED event is posted when an image is ready, which wakes up an
+idle main loop so the image gets drawn.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+import pygame
+from src.utils.image_cache import image_cache
+
+ASSET_LOADED = pygame.event.custom_type()
+
+
+class ImageHandle:
+    """An image that may still be loading"""
+
+    def __init__(self, key, manager, future=None, failed=False):
+        self.key = key
+        self.manager = manager
+        self.future = future
+        self.failed = failed
+        # Only set for images too large for the cache budget
+        self.surface = None
+
+    def is_ready(self):
+        """Check if loading has finished (successfully or not)"""
+        return self.future is None or self.future.done()
+
+    def get(self):
+        """Get the loaded Surface, or None while loading or if the image is missing"""
+        if self.failed or self.surface is not None:
+            return self.surface
+
+        if self.future is not None:
+            if not self.future.done():
+                return None
+            future, self.future = self.future, None
+            # The main loop may already have collected the load into the cache
+            if self.manager.pending.get(self.key) is future:
+                surface, cached = self.manager.finish(self.key, future)
+                if surface is None:
+                    self.failed = True
+                elif not cached:
+                    self.surface = surface
+                return surface
+            if self.key in self.manager.missing:
+                self.failed = True
+                return None
+
+        # Drawn every frame, so this lookup stays out of the hit/miss stats
+        surface = self.manager.cache.peek(self.key)
+        if surface is None:
+            # Evicted to stay within the budget; load it again
+            self.future = self.manager.start_load(self.key)
+        return surface
+
+    def wait(self):
+        """Block until loading has finished and get the Surface (or None)"""
+        if self.future is not None:
+            self.future.exception()
+        return self.get()
+
+
+class AssetManager:
+    def __init__(self, workers=1, cache=image_cache):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        self.cache = cache
+
+        # key -> future of loads in flight, and images known not to exist on disk
+        self.pending = {}
+        self.missing = set()
+
+    def load_image(self, path, size=None, max_size=None, convert="auto"):
+        """
+        Start loading an image and get its handle.
+
+        size scales the image to exactly (width, height); max_size scales it
+        to fit in a max_size x max_size square keeping the aspect ratio.
+        convert is "auto" (convert_alpha() for images with alpha, otherwise
+        convert()), "alpha", "opaque" or None to keep the decoded format.
+        Loaded images come from the shared image cache.
+        """
+        key = (path, size, max_size, convert)
+
+        if key in self.missing:
+            return ImageHandle(key, self, failed=True)
+        if self.cache.get(key) is not None:
+            return ImageHandle(key, self)
+        return ImageHandle(key, self, self.start_load(key))
+
+    def prefetch(self, requests):
+        """Start loading several images, given as (path, size, max_size) tuples"""
+        return [self.load_image(*request) for request in requests]
+
+    def start_load(self, key):
+        """Get the future of a load in flight, or start a new one"""
+        future = self.pending.get(key)
+        if future is None:
+            path, size, max_size, _ = key
+            future = self.executor.submit(_decode_image, path, size, max_size)
+            future.add_done_callback(_notify_loaded)
+            self.pending[key] = future
+        return future
+
+    def finish(self, key, future):
+        """
+        Convert a finished load and move it into the cache (main thread only).
+
+        Returns (surface, cached): the Surface or None if the image is
+        missing, and whether it fit in the cache.
+        """
+        if self.pending.get(key) is future:
+            del self.pending[key]
+
+        try:
+            surface = future.result()
+        except (OSError, pygame.error):
+            surface = None
+        if surface is None:
+            self.missing.add(key)
+            return None, False
+
+        # Pixel format conversion needs the display, so it happens on the main thread
+        surface = _convert(surface, key[3])
+        return surface, self.cache.put(key, surface)
+
+    def collect(self):
+        """Move every finished load into the cache, so prefetched images count against its budget"""
+        for key, future in list(self.pending.items()):
+            if future.done():
+                self.finish(key, future)
+
+    def wait_all(self):
+        """Block until every load in flight has finished, then collect them"""
+        wait(list(self.pending.values()))
+        self.collect()
+
+    def shutdown(self):
+        """Stop the worker thread"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _convert(surface, mode):
+    if mode is None or pygame.display.get_surface() is None:
+        return surface
+    if mode == "alpha" or (mode == "auto" and surface.get_alpha() is not None):
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def _decode_image(path, size, max_size):
+    """Runs on the worker thread"""
+    if not os.path.exists(path):
+        return None
+
+    image = pygame.image.load(path)
+    if size:
+        image = pygame.transform.scale(image, size)
+    elif max_size:
+        width, height = image.get_size()
+        scale = min(max_size / width, max_size / height)
+        image = pygame.transform.scale(image, (int(width * scale), int(height * scale)))
+    return image
+
+
+def _notify_loaded(future):
+    """Runs on the worker thread once the handle's result is set"""
+    if not future.cancelled() and future.exception() is None and future.result() is not None:
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(ASSET_LOADED))
+
+
+# Shared asset manager
+assets = AssetManager()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Background service - Builds fallback gradient backgrounds once and shares them
+"""
+
+import pygame
+
+# Palettes map a vertical position (0.0 at the top, 1.0 at the bottom) to a color
+def _forest_palette(t):
+    color_value = int(255 * (1 - t))
+    blue_value = min(255, color_value * 2)  # 255を超えないようにする
+    return (0, color_value, blue_value)
+
+PALETTES = {
+    "forest": _forest_palette,
+}
+
+DEFAULT_PALETTE = "forest"
+
+# (size, palette) -> Surface
+_gradient_cache = {}
+_cached_size = None
+
+
+def get_gradient_background(size, palette=DEFAULT_PALETTE):
+    """Get the cached gradient Surface for the given size and palette"""
+    global _cached_size
+
+    # A new resolution makes every cached gradient stale
+    if size != _cached_size:
+        clear_background_cache()
+        _cached_size = size
+
+    key = (size, palette)
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        surface = _build_gradient(size, PALETTES[palette])
+        _gradient_cache[key] = surface
+    return surface
+
+
+def clear_background_cache():
+    """Drop all cached backgrounds (e.g. after a resolution change)"""
+    global _cached_size
+    _gradient_cache.clear()
+    _cached_size = None
+
+
+def _build_gradient(size, palette):
+    width, height = size
+    surface = pygame.Surface(size)
+    for y in range(height):
+        pygame.draw.line(surface, palette(y / height), (0, y), (width, y))
+
+    # Match the display format so the per-frame blit is a plain copy
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
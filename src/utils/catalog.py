@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game data catalog - Read-only, indexed view of the content tables in constants.py
+
+Records are frozen mappings, so existing code can keep using record["name"]
+while lookups by name, area or level are O(1) dict hits instead of list scans.
+"""
+
+from types import MappingProxyType
+from src.utils.constants import AREAS, AWS_GUARDIANS, ITEMS, SKILLS
+
+
+def _freeze(record):
+    """Make an immutable copy of a record from constants.py"""
+    frozen = {}
+    for key, value in record.items():
+        if isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, dict):
+            value = MappingProxyType(dict(value))
+        frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+class GameCatalog:
+    def __init__(self, guardians, items, skills, areas):
+        self.areas = tuple(areas)
+        self.guardians = tuple(_freeze(g) for g in guardians)
+        self.items = tuple(_freeze(i) for i in items)
+        self.skills = tuple(_freeze(s) for s in skills)
+
+        # Indexes
+        self._guardians_by_name = {g["name"]: g for g in self.guardians}
+        self._guardians_by_area = {g["area"]: g for g in self.guardians}
+        self._items_by_name = {i["name"]: i for i in self.items}
+        self._skills_by_name = {s["name"]: s for s in self.skills}
+        self.guardian_names = frozenset(self._guardians_by_name)
+
+        # Skills unlocked at each level, from level 1 up to the last unlock
+        self._max_skill_level = max((s["level_required"] for s in self.skills), default=1)
+        self._skills_by_level = {}
+        for level in range(1, self._max_skill_level + 1):
+            self._skills_by_level[level] = tuple(s for s in self.skills if s["level_required"] <= level)
+
+    def guardian(self, name):
+        """Get a guardian by name, or None"""
+        return self._guardians_by_name.get(name)
+
+    def guardian_for_area(self, area):
+        """Get the guardian of an area, or None"""
+        return self._guardians_by_area.get(area)
+
+    def item(self, name):
+        """Get an item by name, or None"""
+        return self._items_by_name.get(name)
+
+    def skill(self, name):
+        """Get a skill by name, or None"""
+        return self._skills_by_name.get(name)
+
+    def skills_for_level(self, level):
+        """Get all skills unlocked at the given player level"""
+        return self._skills_by_level.get(min(level, self._max_skill_level), ())
+
+
+# Shared catalog built once from constants.py
+CATALOG = GameCatalog(AWS_GUARDIANS, ITEMS, SKILLS, AREAS)
@@ -11,6 +11,17 @@ SCREEN_HEIGHT = 600
 
 # Game settings
 FPS = 60
+
+# Scene logic runs in fixed steps of this rate, independent of the frame rate
+UPDATES_PER_SECOND = 60
+# Most logic steps run before a frame is drawn; time beyond that is skipped over
+MAX_UPDATES_PER_FRAME = 5
+
+# Only redraw and push the screen regions that changed each frame
+DIRTY_RECT_RENDERING = False
+
+# Longest time to sleep waiting for input when no scene is animating
+IDLE_TIMEOUT_MS = 1000
 GAME_TITLE = "アマゾン・フォレスト・クエスト：秘宝と七つのAWS守護者"
 
 # Colors
@@ -34,6 +45,12 @@ IMAGES_DIR = f"{ASSETS_DIR}/images"
 SOUNDS_DIR = f"{ASSETS_DIR}/sounds"
 FONTS_DIR = f"{ASSETS_DIR}/fonts"
 
+# Save games
+SAVE_DIR = "saves"
+SAVE_SLOTS = 3
+# Slot written every time the scene changes
+AUTOSAVE_SLOT = 0
+
 # Game areas
 AREAS = [
     "S3湿地帯",
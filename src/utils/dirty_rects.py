@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Dirty rectangle tracking - Scenes and widgets report the screen regions they changed
+"""
+
+import pygame
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Above this many regions a single bounding rect is cheaper to push to the display
+MAX_DIRTY_RECTS = 16
+
+_dirty_rects = []
+_full_redraw = True
+
+
+def mark_dirty(rect):
+    """Report that the given screen region needs to be redrawn"""
+    if not _full_redraw:
+        _dirty_rects.append(pygame.Rect(rect))
+
+
+def mark_all_dirty():
+    """Report that the whole screen needs to be redrawn"""
+    global _full_redraw
+    _full_redraw = True
+    _dirty_rects.clear()
+
+
+def has_dirty_rects():
+    """Check if anything needs to be redrawn"""
+    return _full_redraw or bool(_dirty_rects)
+
+
+def consume_dirty_rects():
+    """Get the regions to redraw this frame and reset the tracker"""
+    global _full_redraw
+    if _full_redraw:
+        _full_redraw = False
+        return [pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]
+
+    rects = _dirty_rects[:]
+    _dirty_rects.clear()
+    if len(rects) > MAX_DIRTY_RECTS:
+        rects = [rects[0].unionall(rects[1:])]
+    return rects
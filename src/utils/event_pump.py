@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Event pump - Shrinks a frame's events before they are handed to the scenes
+
+High polling rate mice and touchscreens queue many MOUSEMOTION events per
+frame, but only the last position matters for hover. Runs of motion are
+merged into one event, and repeated asset-loaded wake-ups into the first.
+Everything else is kept in order.
+
+Key presses are never merged. The game doesn't enable key repeat and
+KEYUP is blocked, so two KEYDOWNs of the same key are two real presses,
+like a doubled letter or two backspaces in a TextInput.
+
+Each logic step's input is handed to the scenes as an InputSnapshot: the
+coalesced events plus the mouse state and key presses they add up to.
+The snapshot is built from the events alone, so a replay sees the same one.
+"""
+
+import pygame
+from src.utils.assets import ASSET_LOADED
+
+
+def coalesce_events(events):
+    """Get the events with motion runs merged and duplicate asset wake-ups dropped"""
+    coalesced = []
+    asset_loaded = False
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and coalesced and coalesced[-1].type == pygame.MOUSEMOTION:
+            # Keep the latest position and buttons, and the total movement
+            previous = coalesced[-1]
+            rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+            coalesced[-1] = pygame.event.Event(pygame.MOUSEMOTION, pos=event.pos, rel=rel, buttons=event.buttons)
+            continue
+        
+        if event.type == ASSET_LOADED:
+            if asset_loaded:
+                continue
+            asset_loaded = True
+        
+        coalesced.append(event)
+    return coalesced
+
+
+class InputSnapshot:
+    """A logic step's input: its coalesced events and what they add up to"""
+
+    def __init__(self, events, mouse_pos=(0, 0), mouse_buttons=(False, False, False)):
+        self.events = events
+        # Mouse position and held buttons after the step's events
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons = mouse_buttons
+        # Keys pressed and positions clicked during the step, in order
+        self.keys = []
+        self.clicks = []
+
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                self.mouse_pos = event.pos
+                self.mouse_buttons = event.buttons
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.mouse_pos = event.pos
+                self.clicks.append(event.pos)
+            elif event.type == pygame.KEYDOWN:
+                self.keys.append(event.key)
+
+
+def snapshot_input(events, previous=None):
+    """Coalesce a step's events into a snapshot, carrying the mouse state over from the previous step"""
+    if previous is None:
+        return InputSnapshot(coalesce_events(events))
+    return InputSnapshot(coalesce_events(events), previous.mouse_pos, previous.mouse_buttons)
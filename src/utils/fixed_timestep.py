@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fixed timestep - Runs scene logic at a fixed rate, independent of rendering
+
+The time since the last frame goes into an accumulator, and the loop runs
+one logic step for every full step it holds. A slow machine draws fewer
+frames but the game keeps its speed; a fast one draws frames without
+running logic in between.
+
+The time source is any function returning milliseconds, so headless runs
+can pass a virtual clock and step as fast as the CPU allows.
+"""
+
+import pygame
+from src.utils.constants import UPDATES_PER_SECOND, MAX_UPDATES_PER_FRAME
+
+
+class FixedTimestep:
+    def __init__(self, updates_per_second=UPDATES_PER_SECOND, max_steps=MAX_UPDATES_PER_FRAME,
+                 time_source=pygame.time.get_ticks):
+        self.step_ms = 1000 / updates_per_second
+        self.max_steps = max_steps
+        self.time_source = time_source
+        
+        # Simulation time in milliseconds (fractional, since steps don't divide 1000 evenly)
+        self.sim_time = 0.0
+        self.accumulator = 0.0
+        self.last_time = None
+    
+    def start(self):
+        """Start the simulation at the current time and return its tick count"""
+        self.last_time = self.time_source()
+        self.sim_time = float(self.last_time)
+        self.accumulator = 0.0
+        return self.last_time
+    
+    def steps(self):
+        """Get the tick counts of the logic steps due this frame"""
+        if self.last_time is None:
+            self.start()
+        
+        now = self.time_source()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+        
+        count = int(self.accumulator // self.step_ms)
+        self.accumulator -= count * self.step_ms
+        
+        # After a long stall (or an idle wait) skip ahead instead of catching up;
+        # timers compare against absolute times, so they still fire on the next step
+        if count > self.max_steps:
+            self.sim_time += (count - self.max_steps) * self.step_ms
+            count = self.max_steps
+        
+        ticks = []
+        for _ in range(count):
+            self.sim_time += self.step_ms
+            ticks.append(int(self.sim_time))
+        return ticks
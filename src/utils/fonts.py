@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Font registry - Loads each font once per process and shares it between scenes
+"""
+
+import pygame
+
+# Font files for each face (regular, bold)
+FONT_FACES = {
+    "noto_cjk": (
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+    ),
+}
+
+DEFAULT_FACE = "noto_cjk"
+FALLBACK_SYSFONT = "Arial"
+
+# Sizes used by the scenes and UI widgets, as (size, bold)
+PRELOAD_SIZES = [
+    (16, False), (20, False), (22, False), (24, False),
+    (36, True), (48, True), (72, True),
+]
+
+# (face, size, bold) -> Font
+_fonts = {}
+# Faces whose font file failed to load; these go straight to SysFont
+_unavailable_faces = set()
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_font(size, bold=False, face=DEFAULT_FACE):
+    """Get the shared Font for the given face, size and weight"""
+    key = (face, size, bold)
+    font = _fonts.get(key)
+    if font is not None:
+        _stats["hits"] += 1
+        return font
+
+    _stats["misses"] += 1
+    font = _load_font(face, size, bold)
+    _fonts[key] = font
+    return font
+
+
+def preload_fonts(sizes=PRELOAD_SIZES, face=DEFAULT_FACE):
+    """Load the given (size, bold) fonts up front, e.g. at startup"""
+    for size, bold in sizes:
+        get_font(size, bold, face)
+
+
+def get_font_stats():
+    """Get hit/miss counters and the number of loaded fonts"""
+    return {
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "loaded": len(_fonts),
+    }
+
+
+def clear_fonts():
+    """Forget all loaded fonts (needed after pygame.font.quit())"""
+    _fonts.clear()
+    _unavailable_faces.clear()
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+
+
+def _load_font(face, size, bold):
+    if face not in _unavailable_faces:
+        regular_path, bold_path = FONT_FACES[face]
+        try:
+            return pygame.font.Font(bold_path if bold else regular_path, size)
+        except (OSError, pygame.error):
+            # Resolve the fallback once instead of retrying the file every time
+            _unavailable_faces.add(face)
+
+    # フォールバックとしてSysFontを使用
+    return pygame.font.SysFont(FALLBACK_SYSFONT, size, bold=bold)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Frame scheduler - Runs at full frame rate while animating and sleeps on input otherwise
+"""
+
+import pygame
+from src.utils.constants import FPS, IDLE_TIMEOUT_MS
+
+
+class FrameScheduler:
+    def __init__(self, fps=FPS, idle_timeout=IDLE_TIMEOUT_MS):
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        
+        # Event that woke us from an idle wait; handed out with the next frame's events
+        self.pending_events = []
+    
+    def get_events(self):
+        """Get all events for this frame"""
+        events = self.pending_events
+        self.pending_events = []
+        events.extend(pygame.event.get())
+        return events
+    
+    def wait_for_next_frame(self, animating):
+        """Cap the frame rate while animating, otherwise block until input arrives"""
+        if animating:
+            self.clock.tick(self.fps)
+            return
+        
+        event = pygame.event.wait(self.idle_timeout)
+        if event.type != pygame.NOEVENT:
+            self.pending_events.append(event)
+        
+        # Restart frame timing so the idle time isn't counted as a slow frame
+        self.clock.tick()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game clock - The time scenes and UI elements see
+
+The main loop latches the simulation time at the start of every logic step
+(see fixed_timestep), so everything in a step sees the same tick count and
+drawing sees the time of the last step. An input replay can then feed the
+recorded step times back and get exactly the same timers and animations.
+
+Where the time comes from is up to the time source:
+- SystemClock: the pygame timer (normal play)
+- FastForwardClock: another source sped up N times
+- VirtualClock: only moves when told to, for scripted and headless runs
+"""
+
+import pygame
+
+
+class SystemClock:
+    """Milliseconds since pygame was initialized"""
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class VirtualClock:
+    """A clock that only advances when told to"""
+
+    def __init__(self, start=0):
+        self.ticks = start
+
+    def get_ticks(self):
+        return int(self.ticks)
+
+    def advance(self, ms):
+        self.ticks += ms
+
+
+class FastForwardClock:
+    """Runs another time source `speed` times faster, counting from when it was created"""
+
+    def __init__(self, speed, source=None):
+        self.speed = speed
+        self.source = source or SystemClock()
+        self.origin = self.source.get_ticks()
+
+    def get_ticks(self):
+        return self.origin + int((self.source.get_ticks() - self.origin) * self.speed)
+
+
+class GameClock:
+    """The latched time of the current logic step, read from a time source"""
+
+    def __init__(self, source=None):
+        self.source = source or SystemClock()
+        # Tick count of the current step, or None to read the source directly
+        self.frame_ticks = None
+
+    def begin_frame(self, ticks=None):
+        """Latch the time for a new step (the source's time, or the given ticks) and return it"""
+        self.frame_ticks = self.source.get_ticks() if ticks is None else ticks
+        return self.frame_ticks
+
+    def get_ticks(self):
+        """Milliseconds since the game started, as of the start of the current step"""
+        if self.frame_ticks is None:
+            return self.source.get_ticks()
+        return self.frame_ticks
+
+    def reset(self):
+        """Go back to reading the source directly"""
+        self.frame_ticks = None
+
+
+# Used by a SceneManager created without a clock, and by UI elements given none
+default_clock = GameClock()
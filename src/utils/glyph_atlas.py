@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Glyph atlas - Rasterizes each character once per font and builds strings from it
+
+Every character is rendered into a page of a packed atlas the first time a
+font and color need it. A string is then laid out by simply adding up the
+glyph advances, with no kerning, and copied out of the atlas, so new strings
+like battle messages don't go through FreeType again. Text that needs real
+shaping (combining marks, characters outside the BMP, control characters)
+and non-antialiased text fall back to Font.render.
+"""
+
+import unicodedata
+import pygame
+
+ATLAS_PAGE_SIZE = 512
+
+# (font, color) -> GlyphAtlas
+_atlases = {}
+_stats = {"strings": 0, "fallbacks": 0, "font_renders": 0}
+
+
+class GlyphAtlas:
+    def __init__(self, font, color, page_size=ATLAS_PAGE_SIZE):
+        self.font = font
+        self.color = color
+        self.page_size = page_size
+
+        # char -> (page index, area Rect); None for characters that can't go in the atlas
+        self.glyphs = {}
+        self.pages = []
+
+        # Shelf packing position in the last page
+        self.cursor_x = 0
+        self.cursor_y = 0
+        self.shelf_height = 0
+
+    def render(self, text):
+        """Render a string from atlas glyphs, or None if it needs Font.render"""
+        glyphs = self.glyphs
+        width = 0
+        height = 0
+        for char in text:
+            glyph = glyphs.get(char, False)
+            if glyph is False:
+                glyph = self._add_glyph(char)
+            if glyph is None:
+                return None
+            area = glyph[1]
+            width += area.width
+            if area.height > height:
+                height = area.height
+        if not width:
+            return None
+
+        # Like Font.render, the string is as tall as its tallest glyph (descenders add a few
+        # pixels). Glyph cells don't overlap, so copying them with BLEND_RGBA_MAX onto a
+        # zeroed surface gives exactly the glyph pixels.
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pages = self.pages
+        blits = []
+        x = 0
+        for char in text:
+            page, area = glyphs[char]
+            blits.append((pages[page], (x, 0), area, pygame.BLEND_RGBA_MAX))
+            x += area.width
+        surface.blits(blits, doreturn=False)
+        return surface
+
+    def _add_glyph(self, char):
+        if not _is_simple(char):
+            self.glyphs[char] = None
+            return None
+
+        image = self.font.render(char, True, self.color)
+        _stats["font_renders"] += 1
+        width, height = image.get_size()
+
+        # Next shelf, then next page, when the glyph doesn't fit
+        if not self.pages or self.cursor_x + width > self.page_size:
+            self.cursor_x = 0
+            self.cursor_y += self.shelf_height
+            self.shelf_height = 0
+        if not self.pages or self.cursor_y + height > self.page_size:
+            self.pages.append(self._new_page())
+            self.cursor_x = 0
+            self.cursor_y = 0
+            self.shelf_height = 0
+
+        area = pygame.Rect(self.cursor_x, self.cursor_y, width, height)
+        self.pages[-1].blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+        self.cursor_x += width
+        self.shelf_height = max(self.shelf_height, height)
+
+        glyph = (len(self.pages) - 1, area)
+        self.glyphs[char] = glyph
+        return glyph
+
+    def _new_page(self):
+        # Blank pixels carry the glyph color, so antialiased edges never pick up black
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((*self.color, 0))
+        return page
+
+
+def render_glyphs(font, text, color, antialias=True):
+    """Render text through the font's glyph atlas, falling back to Font.render"""
+    surface = None
+    if antialias:
+        key = (font, tuple(color[:3]))
+        atlas = _atlases.get(key)
+        if atlas is None:
+            atlas = _atlases[key] = GlyphAtlas(font, key[1])
+        surface = atlas.render(text)
+
+    if surface is None:
+        _stats["fallbacks"] += 1
+        return render_with_font(font, text, color, antialias)
+    _stats["strings"] += 1
+    return surface
+
+
+def render_with_font(font, text, color, antialias=True):
+    """Render text with Font.render, counted in the stats"""
+    _stats["font_renders"] += 1
+    return font.render(text, antialias, color)
+
+
+def get_glyph_atlas_stats():
+    """Get the number of atlases, pages and glyphs, how many strings used them and the Font.render calls"""
+    return {
+        "atlases": len(_atlases),
+        "pages": sum(len(atlas.pages) for atlas in _atlases.values()),
+        "glyphs": sum(len(atlas.glyphs) for atlas in _atlases.values()),
+        "strings": _stats["strings"],
+        "fallbacks": _stats["fallbacks"],
+        "font_renders": _stats["font_renders"],
+    }
+
+
+def clear_glyph_atlases():
+    """Drop all atlases (needed after pygame.font.quit())"""
+    _atlases.clear()
+
+
+def _is_simple(char):
+    # Control/format characters, combining marks and line separators need shaping
+    if ord(char) > 0xFFFF:
+        return False
+    category = unicodedata.category(char)
+    return category[0] not in "CM" and category not in ("Zl", "Zp")
+
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Image cache - Process-wide cache of decoded, scaled and converted images
+
+Entries are keyed by (path, target size, convert mode) and the cache keeps
+the total pixel memory under a byte budget by evicting the least recently
+used images.
+"""
+
+from collections import OrderedDict
+
+# Default memory budget for cached images
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024
+
+
+def surface_bytes(surface):
+    """Approximate pixel memory used by a Surface"""
+    return surface.get_pitch() * surface.get_height()
+
+
+class ImageCache:
+    def __init__(self, budget=IMAGE_CACHE_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key):
+        """Get a cached Surface, or None"""
+        surface = self.entries.get(key)
+        if surface is None:
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return surface
+
+    def peek(self, key):
+        """Get a cached Surface, or None, without counting a hit or miss (for per-frame lookups)"""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+        return surface
+
+    def put(self, key, surface):
+        """Add a Surface, evicting old entries to stay within the budget. Returns False if it doesn't fit."""
+        if key in self.entries:
+            self.used -= surface_bytes(self.entries.pop(key))
+
+        size = surface_bytes(surface)
+        if size > self.budget:
+            # Never cache something that would flush everything else
+            return False
+
+        self.entries[key] = surface
+        self.used += size
+        self._evict()
+        return True
+
+    def set_budget(self, budget):
+        """Change the byte budget"""
+        self.budget = budget
+        self._evict()
+
+    def clear(self):
+        """Drop every cached image"""
+        self.entries.clear()
+        self.used = 0
+
+    def get_stats(self):
+        """Get hit/miss/eviction counters and memory use"""
+        return dict(self.stats, entries=len(self.entries), used=self.used, budget=self.budget)
+
+    def _evict(self):
+        while self.used > self.budget and self.entries:
+            _, surface = self.entries.popitem(last=False)
+            self.used -= surface_bytes(surface)
+            self.stats["evictions"] += 1
+
+
+# Shared image cache
+image_cache = ImageCache()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Input log - Compact binary recording of a play session
+
+A log holds the random seed and the start time, then one record per logic
+step with the step's time and the input events the scenes received. Seeding
+`random`, latching the same step times in the game clock and feeding the
+same events reproduces the session exactly.
+
+Layout (little endian):
+    header: magic "AFQR", version (u16), seed (i64), start ticks (u32)
+    frame:  ticks since the previous step (u32), event count (u16), events
+    event:  type code (u8) followed by its fields; text is a u8 byte length
+            and UTF-8 bytes
+
+Version 1 logs stored the seed unsigned; they are still read.
+"""
+
+import struct
+import pygame
+
+MAGIC = b"AFQR"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHqI")
+# Version 1 header, with an unsigned seed
+HEADER_V1 = struct.Struct("<4sHQI")
+# Seeds a log can hold
+SEED_MIN = -2 ** 63
+SEED_MAX = 2 ** 63 - 1
+FRAME = struct.Struct("<IH")
+EVENT_CODE = struct.Struct("<B")
+TEXT_LENGTH = struct.Struct("<B")
+
+# Type code -> (pygame event type, struct for the fields, field names, has text)
+EVENT_FORMATS = {
+    1: (pygame.QUIT, None, (), False),
+    2: (pygame.MOUSEMOTION, struct.Struct("<hhhhB"), ("x", "y", "rel_x", "rel_y", "buttons"), False),
+    3: (pygame.MOUSEBUTTONDOWN, struct.Struct("<hhB"), ("x", "y", "button"), False),
+    4: (pygame.MOUSEBUTTONUP, struct.Struct("<hhB"), ("x", "y", "button"), False),
+    5: (pygame.KEYDOWN, struct.Struct("<iHH"), ("key", "mod", "scancode"), True),
+    6: (pygame.KEYUP, struct.Struct("<iHH"), ("key", "mod", "scancode"), True),
+    7: (pygame.TEXTINPUT, None, (), True),
+    8: (pygame.MOUSEWHEEL, struct.Struct("<hh"), ("x", "y"), False),
+}
+EVENT_CODES = {event_type: code for code, (event_type, _, _, _) in EVENT_FORMATS.items()}
+
+
+class InputLogError(Exception):
+    """The file is not an input log this version can read"""
+
+
+class InputRecorder:
+    def __init__(self, path, seed, start_ticks):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, start_ticks))
+        self.last_ticks = start_ticks
+        self.frames = 0
+
+    def record_frame(self, ticks, events):
+        """Write one frame; events that scenes don't react to (window, asset) are left out"""
+        recorded = [event for event in events if event.type in EVENT_CODES]
+        chunks = [FRAME.pack(ticks - self.last_ticks, len(recorded))]
+        for event in recorded:
+            chunks.append(_encode_event(event))
+        self.file.write(b"".join(chunks))
+        self.last_ticks = ticks
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+
+def read_input_log(path):
+    """
+    Read an input log.
+
+    Returns (seed, start_ticks, frames) where frames is a list of
+    (ticks, events) in recorded order.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < HEADER.size:
+        raise InputLogError(f"{path}: too short for an input log")
+    magic, version, seed, start_ticks = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise InputLogError(f"{path}: not an input log")
+    if version == 1:
+        magic, version, seed, start_ticks = HEADER_V1.unpack_from(data, 0)
+    elif version != VERSION:
+        raise InputLogError(f"{path}: unsupported input log version {version}")
+
+    frames = []
+    offset = HEADER.size
+    ticks = start_ticks
+    # A session that was killed mid-write may end with a partial frame; it is dropped
+    try:
+        while offset < len(data):
+            delta, count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            events = []
+            for _ in range(count):
+                event, offset = _decode_event(data, offset)
+                events.append(event)
+            ticks += delta
+            frames.append((ticks, events))
+    except struct.error:
+        pass
+    return seed, start_ticks, frames
+
+
+def _encode_event(event):
+    code = EVENT_CODES[event.type]
+    _, fields, _, has_text = EVENT_FORMATS[code]
+    chunks = [EVENT_CODE.pack(code)]
+
+    if event.type == pygame.MOUSEMOTION:
+        buttons = sum(1 << i for i, pressed in enumerate(event.buttons) if pressed)
+        chunks.append(fields.pack(*event.pos, *event.rel, buttons))
+    elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        chunks.append(fields.pack(*event.pos, event.button))
+    elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        chunks.append(fields.pack(event.key, event.mod, getattr(event, "scancode", 0)))
+    elif event.type == pygame.MOUSEWHEEL:
+        chunks.append(fields.pack(event.x, event.y))
+
+    if has_text:
+        text = getattr(event, "text", None) or getattr(event, "unicode", "")
+        encoded = text.encode("utf-8")[:255]
+        chunks.append(TEXT_LENGTH.pack(len(encoded)) + encoded)
+    return b"".join(chunks)
+
+
+def _decode_event(data, offset):
+    (code,) = EVENT_CODE.unpack_from(data, offset)
+    offset += EVENT_CODE.size
+    if code not in EVENT_FORMATS:
+        raise InputLogError(f"unknown event code {code}")
+    event_type, fields, names, has_text = EVENT_FORMATS[code]
+
+    values = {}
+    if fields is not None:
+        values = dict(zip(names, fields.unpack_from(data, offset)))
+        offset += fields.size
+
+    text = ""
+    if has_text:
+        (length,) = TEXT_LENGTH.unpack_from(data, offset)
+        offset += TEXT_LENGTH.size
+        text = data[offset:offset + length].decode("utf-8", errors="replace")
+        offset += length
+
+    if event_type == pygame.MOUSEMOTION:
+        buttons = tuple(bool(values["buttons"] & (1 << i)) for i in range(3))
+        attributes = {"pos": (values["x"], values["y"]), "rel": (values["rel_x"], values["rel_y"]), "buttons": buttons}
+    elif event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        attributes = {"pos": (values["x"], values["y"]), "button": values["button"]}
+    elif event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        attributes = {"key": values["key"], "mod": values["mod"], "scancode": values["scancode"], "unicode": text}
+    elif event_type == pygame.TEXTINPUT:
+        attributes = {"text": text}
+    elif event_type == pygame.MOUSEWHEEL:
+        attributes = {"x": values["x"], "y": values["y"]}
+    else:
+        attributes = {}
+    return pygame.event.Event(event_type, attributes), offset
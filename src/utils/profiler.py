@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Frame profiler - Times the main loop per scene and counts render calls
+
+While enabled, every frame records how long events, update, draw and present
+took for the active scene class. It also records how many blits, fills,
+draw.line/rect/circle calls and font renders the frame made. Scenes draw
+into a counting canvas that is copied to the screen, so enabling the
+profiler adds one full-screen blit per frame.
+
+F3 toggles an on-screen overlay with percentiles, call counts, cache hit
+rates and a frame-time histogram. F4 writes the rolling p50/p95/p99 per
+scene class to a JSON report.
+"""
+
+import json
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+import pygame
+from src.utils.dirty_rects import mark_dirty
+from src.utils.fonts import get_font, get_font_stats
+from src.utils.glyph_atlas import get_glyph_atlas_stats
+from src.utils.image_cache import image_cache
+from src.utils.text_cache import get_text_cache_stats
+from src.utils.constants import FPS
+
+SECTIONS = ("events", "update", "draw", "present")
+COUNTED_DRAW_FUNCTIONS = ("line", "rect", "circle")
+PERCENTILES = (50, 95, 99)
+
+# Frames kept per scene class for the rolling percentiles
+PROFILE_WINDOW = 600
+PROFILE_REPORT_PATH = "profile.json"
+
+# Overlay layout; its text is only re-rendered a few times per second
+OVERLAY_REFRESH_MS = 250
+OVERLAY_POS = (10, 10)
+OVERLAY_SIZE = (380, 200)
+HISTOGRAM_BUCKET_MS = 2
+HISTOGRAM_BUCKETS = 17  # The last bucket collects everything slower
+# Bars beyond one frame at the target frame rate are drawn red
+FRAME_BUDGET_MS = 1000 / FPS
+
+# The overlay draws with the real functions, so it never counts itself
+_draw_rect = pygame.draw.rect
+
+
+class CountingSurface(pygame.Surface):
+    """A Surface that counts the blits and fills made on it"""
+
+    def __init__(self, size, counts):
+        super().__init__(size)
+        self.counts = counts
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.counts["blit"] += 1
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        self.counts["blit"] += len(blit_sequence)
+        return super().blits(blit_sequence, doreturn)
+
+    def fill(self, color, rect=None, special_flags=0):
+        self.counts["fill"] += 1
+        return super().fill(color, rect, special_flags)
+
+
+class FrameProfiler:
+    def __init__(self, window=PROFILE_WINDOW, report_path=PROFILE_REPORT_PATH):
+        self.window = window
+        self.report_path = report_path
+        self.enabled = False
+        self.overlay_visible = False
+
+        # Scene class name -> {"frame"/section: deque of ms, "calls": deque of Counters}
+        self.scenes = {}
+        # Frame times of every scene, for the histogram
+        self.recent_frames = deque(maxlen=window)
+
+        # Current frame
+        self.scene_name = None
+        self.frame_start = 0.0
+        self.section_times = dict.fromkeys(SECTIONS, 0.0)
+        self.counts = Counter()
+        self.font_renders_start = 0
+
+        self.canvas = None
+        self._original_draw = {}
+
+        self.overlay = None
+        self.overlay_time = 0
+
+    def enable(self):
+        """Start recording frames"""
+        if self.enabled:
+            return
+        self.enabled = True
+
+        # pygame.draw functions are looked up at call time, so wrapping them counts every call
+        for name in COUNTED_DRAW_FUNCTIONS:
+            function = getattr(pygame.draw, name)
+            self._original_draw[name] = function
+            setattr(pygame.draw, name, self._counting(f"draw.{name}", function))
+
+    def disable(self):
+        """Stop recording frames and hide the overlay"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.overlay_visible = False
+        self.canvas = None
+        self.scene_name = None
+
+        for name, function in self._original_draw.items():
+            setattr(pygame.draw, name, function)
+        self._original_draw.clear()
+
+    def toggle_overlay(self):
+        """Show or hide the overlay; showing it starts the profiler"""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enable()
+            self.overlay = None
+        mark_dirty(pygame.Rect(OVERLAY_POS, OVERLAY_SIZE))
+
+    def handle_event(self, event):
+        """Handle the profiler keys. Returns True if the event was used."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_F3:
+            self.toggle_overlay()
+            return True
+        if event.key == pygame.K_F4 and self.enabled:
+            self.export()
+            return True
+        return False
+
+    # Frame recording
+
+    def begin_frame(self, scene):
+        """Start timing a frame for the given (active) scene"""
+        if not self.enabled:
+            return
+        self.scene_name = type(scene).__name__
+        self.section_times = dict.fromkeys(SECTIONS, 0.0)
+        self.counts = Counter()
+        if self.canvas is not None:
+            self.canvas.counts = self.counts
+        self.font_renders_start = get_glyph_atlas_stats()["font_renders"]
+        self.frame_start = time.perf_counter()
+
+    @contextmanager
+    def section(self, name):
+        """Time a part of the frame"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.section_times[name] += time.perf_counter() - start
+
+    def end_frame(self):
+        """Record the frame (call before waiting for the next one)"""
+        if not self.enabled or self.scene_name is None:
+            return
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.counts["font.render"] = get_glyph_atlas_stats()["font_renders"] - self.font_renders_start
+
+        samples = self.scenes.get(self.scene_name)
+        if samples is None:
+            samples = {key: deque(maxlen=self.window) for key in ("frame", "calls") + SECTIONS}
+            self.scenes[self.scene_name] = samples
+        samples["frame"].append(frame_ms)
+        for name, seconds in self.section_times.items():
+            samples[name].append(seconds * 1000)
+        samples["calls"].append(self.counts)
+        self.recent_frames.append(frame_ms)
+
+        # Keep the overlay's region in the next frame's redraw
+        if self.overlay_visible:
+            mark_dirty(pygame.Rect(OVERLAY_POS, OVERLAY_SIZE))
+
+    # Drawing
+
+    def get_canvas(self, screen):
+        """Get the surface to draw the scene on: the screen, or the counting canvas"""
+        if not self.enabled:
+            return screen
+        if self.canvas is None or self.canvas.get_size() != screen.get_size():
+            self.canvas = CountingSurface(screen.get_size(), self.counts)
+        return self.canvas
+
+    def present(self, screen, canvas, area=None):
+        """Copy the canvas to the screen and draw the overlay on top"""
+        if canvas is not screen:
+            if area is None:
+                screen.blit(canvas, (0, 0))
+            else:
+                screen.blit(canvas, area, area)
+        if self.overlay_visible:
+            now = pygame.time.get_ticks()
+            if self.overlay is None or now - self.overlay_time >= OVERLAY_REFRESH_MS:
+                self.overlay = self._render_overlay()
+                self.overlay_time = now
+            screen.blit(self.overlay, OVERLAY_POS)
+
+    # Reports
+
+    def get_report(self):
+        """Get the rolling percentiles and mean call counts per scene class, and the cache hit rates"""
+        scenes = {}
+        for name, samples in self.scenes.items():
+            calls = Counter()
+            for counts in samples["calls"]:
+                calls.update(counts)
+            frames = len(samples["frame"])
+            scenes[name] = {
+                "frames": frames,
+                "frame_ms": _percentiles(samples["frame"]),
+                "sections_ms": {section: _percentiles(samples[section]) for section in SECTIONS},
+                "calls_per_frame": {key: round(count / frames, 2) for key, count in sorted(calls.items())},
+            }
+        return {"scenes": scenes, "cache_hit_rates": get_cache_hit_rates()}
+
+    def export(self, path=None):
+        """Write the report as JSON"""
+        with open(path or self.report_path, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, ensure_ascii=False, indent=2)
+
+    def _counting(self, name, function):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return function(*args, **kwargs)
+        return counted
+
+    def _render_overlay(self):
+        overlay = pygame.Surface(OVERLAY_SIZE, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        font = get_font(16)
+
+        lines = ["F3: close  F4: save report"]
+        samples = self.scenes.get(self.scene_name)
+        if samples:
+            frame = _percentiles(samples["frame"])
+            lines.append(f"{self.scene_name}  frame p50 {frame['p50']:.2f}  p95 {frame['p95']:.2f}  "
+                         f"p99 {frame['p99']:.2f} ms")
+            lines.append("  ".join(f"{section} {_percentiles(samples[section])['p50']:.2f}"
+                                   for section in SECTIONS))
+            calls = samples["calls"][-1]
+            lines.append("  ".join(f"{key} {calls[key]}" for key in ("blit", "fill", "font.render"))
+                         + "  draw " + "/".join(str(calls[f"draw.{name}"]) for name in COUNTED_DRAW_FUNCTIONS))
+        rates = get_cache_hit_rates()
+        lines.append("hit rate  " + "  ".join(f"{name} {rate:.0%}" for name, rate in rates.items() if rate is not None))
+
+        # Text changes every refresh, so it skips the shared text cache
+        y = 4
+        for line in lines:
+            overlay.blit(font.render(line, True, (255, 255, 255)), (6, y))
+            y += font.get_linesize()
+
+        self._draw_histogram(overlay, pygame.Rect(6, y + 6, OVERLAY_SIZE[0] - 12, OVERLAY_SIZE[1] - y - 12))
+        return overlay
+
+    def _draw_histogram(self, surface, rect):
+        buckets = [0] * HISTOGRAM_BUCKETS
+        for frame_ms in self.recent_frames:
+            buckets[min(int(frame_ms // HISTOGRAM_BUCKET_MS), HISTOGRAM_BUCKETS - 1)] += 1
+        tallest = max(buckets) or 1
+
+        bar_width = rect.width // HISTOGRAM_BUCKETS
+        for i, count in enumerate(buckets):
+            height = rect.height * count // tallest
+            # Green within the frame budget, red beyond it
+            color = (100, 220, 100) if (i + 1) * HISTOGRAM_BUCKET_MS <= FRAME_BUDGET_MS else (230, 90, 90)
+            _draw_rect(surface, color, (rect.x + i * bar_width, rect.bottom - height, bar_width - 2, height))
+        _draw_rect(surface, (200, 200, 200), rect, 1)
+
+
+def get_cache_hit_rates():
+    """Hit rates of the shared caches since startup (None before the first lookup)"""
+    text = get_text_cache_stats()
+    fonts = get_font_stats()
+    images = image_cache.get_stats()
+    atlas = get_glyph_atlas_stats()
+    return {
+        "text": _rate(text["hits"], text["misses"]),
+        "fonts": _rate(fonts["hits"], fonts["misses"]),
+        "images": _rate(images["hits"], images["misses"]),
+        "glyph_atlas": _rate(atlas["strings"], atlas["fallbacks"]),
+    }
+
+
+def _rate(hits, misses):
+    total = hits + misses
+    return hits / total if total else None
+
+
+def _percentiles(values):
+    ordered = sorted(values)
+    result = {}
+    for p in PERCENTILES:
+        if ordered:
+            # Nearest-rank percentile
+            index = max(0, -(-len(ordered) * p // 100) - 1)
+            result[f"p{p}"] = round(ordered[index], 3)
+        else:
+            result[f"p{p}"] = 0.0
+    return result
+
+
+# Shared profiler used by the main loop
+profiler = FrameProfiler()
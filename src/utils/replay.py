@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Replay - Plays a recorded input log back without a window
+
+The log's seed goes into `random`, each logic step's recorded time is
+latched in the game clock and its events are fed through
+SceneManager.handle_input, so the session plays out exactly as it was
+recorded. Steps run back to back with no frame cap. Scenes are only drawn
+with --draw, which makes the replay a realistic load profile for
+benchmarking.
+
+Usage:
+    python main.py --record session.afqr
+    python -m src.utils.replay session.afqr --draw
+"""
+
+import argparse
+import os
+import random
+import time
+
+# Must be set before pygame initializes the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.utils.game_clock import GameClock, VirtualClock
+from src.utils.event_pump import snapshot_input
+from src.utils.input_log import read_input_log
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def replay(path, draw=False):
+    """
+    Replay an input log.
+
+    Returns a dict with the frame count, the wall time it took, the replayed
+    game time and the name of the scene that was active at the end.
+    """
+    from src.scenes.scene_manager import SceneManager
+    from src.scenes.title_scene import TitleScene
+    from src.utils.fonts import preload_fonts
+    from src.utils.text_cache import reset_render_caches
+    from src.utils.assets import assets
+
+    seed, start_ticks, frames = read_input_log(path)
+
+    random.seed(seed)
+    pygame.init()
+    # Fonts from an earlier replay in this process were freed by pygame.quit()
+    reset_render_caches()
+    preload_fonts()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Time only moves with the recorded steps
+    clock = GameClock(VirtualClock(start_ticks))
+
+    try:
+        # The title scene is built at the recorded start time, like in main()
+        clock.begin_frame(start_ticks)
+        scene_manager = SceneManager(clock)
+        scene_manager.show_scene(TitleScene)
+
+        start = time.perf_counter()
+        input_snapshot = None
+        for ticks, events in frames:
+            clock.begin_frame(ticks)
+            input_snapshot = snapshot_input(events, input_snapshot)
+            scene_manager.handle_input(input_snapshot)
+            scene_manager.update()
+            if draw:
+                screen.fill((0, 0, 0))
+                scene_manager.draw(screen)
+                pygame.display.flip()
+        elapsed = time.perf_counter() - start
+
+        end_ticks = frames[-1][0] if frames else start_ticks
+        return {
+            "frames": len(frames),
+            "seconds": elapsed,
+            "game_seconds": (end_ticks - start_ticks) / 1000,
+            "final_scene": type(scene_manager.get_active_scene()).__name__,
+        }
+    finally:
+        assets.shutdown()
+        pygame.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session without a window")
+    parser.add_argument("log", help="input log written by main.py --record")
+    parser.add_argument("--draw", action="store_true", help="also draw every frame (for benchmarking)")
+    args = parser.parse_args()
+
+    result = replay(args.log, draw=args.draw)
+    fps = result["frames"] / result["seconds"] if result["seconds"] else 0.0
+    print(f"replayed {result['frames']} frames ({result['game_seconds']:.1f}s of play) "
+          f"in {result['seconds']:.3f}s, {fps:.1f} frames/s")
+    print(f"final scene: {result['final_scene']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Save game - Compact binary save slots with a background writer
+
+A save holds the player state and the name of the scene it was made in.
+Files are written to a temporary file and renamed over the slot, so a crash
+mid-write leaves the previous save intact. Autosaves are encoded and
+written on a worker thread, so changing scenes never waits on the disk.
+
+Layout (little endian):
+    header:  magic "AFQS", version (u16), CRC-32 of the payload (u32),
+             payload length (u32)
+    payload: scene, name, motivation/aws_knowledge/concentration/level (4 x i32),
+             items (u8 count of name + u16 count), skills (u8 count of names),
+             completed trials (u8 count of names)
+    text is a u8 byte length and UTF-8 bytes
+"""
+
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.constants import SAVE_DIR, SAVE_SLOTS
+
+MAGIC = b"AFQS"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHII")
+STATS = struct.Struct("<iiii")
+COUNT = struct.Struct("<B")
+ITEM_COUNT = struct.Struct("<H")
+
+
+class SaveGameError(Exception):
+    """The save file is damaged or from an unsupported version"""
+
+
+def slot_path(slot, save_dir=SAVE_DIR):
+    if not 0 <= slot < SAVE_SLOTS:
+        raise ValueError(f"save slot must be between 0 and {SAVE_SLOTS - 1}")
+    return os.path.join(save_dir, f"slot{slot}.sav")
+
+
+def encode_save(scene_name, snapshot):
+    """Encode a scene name and a PlayerState snapshot as a save file"""
+    (name, motivation, aws_knowledge, concentration, level,
+     items, skills, completed_trials) = snapshot
+
+    chunks = [_pack_text(scene_name), _pack_text(name),
+              STATS.pack(motivation, aws_knowledge, concentration, level)]
+    chunks.append(COUNT.pack(len(items)))
+    for item_name, count in items:
+        chunks.append(_pack_text(item_name) + ITEM_COUNT.pack(count))
+    for names in (skills, completed_trials):
+        chunks.append(COUNT.pack(len(names)))
+        chunks.extend(_pack_text(entry) for entry in names)
+
+    payload = b"".join(chunks)
+    return HEADER.pack(MAGIC, VERSION, zlib.crc32(payload), len(payload)) + payload
+
+
+def decode_save(data):
+    """Decode a save file. Returns (scene_name, snapshot)."""
+    if len(data) < HEADER.size:
+        raise SaveGameError("too short for a save file")
+    magic, version, checksum, length = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveGameError("not a save file")
+    if version != VERSION:
+        raise SaveGameError(f"unsupported save version {version}")
+    payload = data[HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise SaveGameError("save file is damaged")
+
+    try:
+        scene_name, offset = _unpack_text(payload, 0)
+        name, offset = _unpack_text(payload, offset)
+        stats = STATS.unpack_from(payload, offset)
+        offset += STATS.size
+
+        (count,) = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        items = []
+        for _ in range(count):
+            item_name, offset = _unpack_text(payload, offset)
+            (item_count,) = ITEM_COUNT.unpack_from(payload, offset)
+            offset += ITEM_COUNT.size
+            items.append((item_name, item_count))
+
+        lists = []
+        for _ in range(2):
+            (count,) = COUNT.unpack_from(payload, offset)
+            offset += COUNT.size
+            entries = []
+            for _ in range(count):
+                entry, offset = _unpack_text(payload, offset)
+                entries.append(entry)
+            lists.append(tuple(entries))
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SaveGameError(f"save file is damaged: {e}") from e
+
+    return scene_name, (name, *stats, tuple(items), *lists)
+
+
+def write_save(slot, scene_name, snapshot, save_dir=SAVE_DIR):
+    """Write a save slot atomically"""
+    path = slot_path(slot, save_dir)
+    os.makedirs(save_dir, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(encode_save(scene_name, snapshot))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def read_save(slot, save_dir=SAVE_DIR):
+    """Read a save slot. Returns (scene_name, snapshot), or None if the slot is empty."""
+    try:
+        with open(slot_path(slot, save_dir), "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return decode_save(data)
+
+
+class SaveWriter:
+    """Writes saves on a worker thread, in the order they were made"""
+
+    def __init__(self, save_dir=SAVE_DIR):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+        self.save_dir = save_dir
+
+    def save(self, slot, scene_name, snapshot):
+        """Queue a save; the snapshot must not change afterwards (PlayerState.snapshot() is immutable)"""
+        future = self.executor.submit(write_save, slot, scene_name, snapshot, self.save_dir)
+        future.add_done_callback(_report_failure)
+        return future
+
+    def shutdown(self):
+        """Finish the queued saves and stop the worker thread"""
+        self.executor.shutdown(wait=True)
+
+
+def _pack_text(text):
+    encoded = text.encode("utf-8")
+    if len(encoded) > 255:
+        raise ValueError(f"text too long for a save file: {text!r}")
+    return COUNT.pack(len(encoded)) + encoded
+
+
+def _unpack_text(data, offset):
+    (length,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    end = offset + length
+    if end > len(data):
+        raise struct.error("text runs past the end of the save")
+    return data[offset:end].decode("utf-8"), end
+
+
+def _report_failure(future):
+    error = future.exception()
+    if error is not None:
+        print(f"Warning: Saving the game failed: {error}")
+
+
+# Shared writer used for autosaves
+save_writer = SaveWriter()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Text cache - Keeps rendered text surfaces so unchanged text is rasterized once
+
+Misses go straight to Font.render. Composing whole strings from the glyph
+atlas measured slower at the 20-24px sizes most UI text uses, so the atlas
+is only used by the typewriter, which appends a few characters at a time.
+"""
+
+from collections import OrderedDict
+from src.utils.fonts import clear_fonts
+from src.utils.glyph_atlas import render_with_font, clear_glyph_atlases
+
+# Maximum number of rendered surfaces kept before the least recently used is dropped
+MAX_TEXT_SURFACES = 512
+
+# (font, text, color, antialias) -> Surface, ordered from least to most recently used
+_surfaces = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_max_entries = MAX_TEXT_SURFACES
+
+
+def render_text(font, text, color, antialias=True):
+    """Render text with the given font, reusing a cached surface when possible"""
+    key = (font, text, tuple(color), antialias)
+    surface = _surfaces.get(key)
+    if surface is not None:
+        _surfaces.move_to_end(key)
+        _stats["hits"] += 1
+        return surface
+
+    _stats["misses"] += 1
+    surface = render_with_font(font, text, color, antialias)
+    _surfaces[key] = surface
+    while len(_surfaces) > _max_entries:
+        _surfaces.popitem(last=False)
+        _stats["evictions"] += 1
+    return surface
+
+
+def set_text_cache_size(max_entries):
+    """Change the maximum number of cached surfaces"""
+    global _max_entries
+    _max_entries = max_entries
+    while len(_surfaces) > _max_entries:
+        _surfaces.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+def get_text_cache_stats():
+    """Get hit/miss/eviction counters and the current cache size"""
+    return {
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "evictions": _stats["evictions"],
+        "size": len(_surfaces),
+        "max_size": _max_entries,
+    }
+
+
+def clear_text_cache():
+    """Drop all cached surfaces"""
+    _surfaces.clear()
+
+
+def reset_render_caches():
+    """
+    Forget all fonts, rendered text and glyph atlases.
+
+    Fonts are freed by pygame.quit() / pygame.font.quit(), and the text and
+    atlas caches are keyed by Font objects, so call this whenever pygame is
+    initialized again.
+    """
+    clear_text_cache()
+    clear_glyph_atlases()
+    clear_fonts()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared fixtures
+"""
+
+import os
+import pytest
+
+# Must be set before pygame is imported anywhere in the test session
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def screen():
+    """Initialize pygame with a dummy display; skipped when pygame isn't installed"""
+    pygame = pytest.importorskip("pygame")
+    from src.utils.text_cache import reset_render_caches
+    from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    pygame.init()
+    try:
+        yield pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    finally:
+        pygame.quit()
+        # Cached fonts (and text keyed by them) were freed along with pygame
+        reset_render_caches()
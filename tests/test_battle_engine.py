@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the headless battle engine
+"""
+
+import random
+from src.engine.battle_engine import BattleEngine
+from src.entities.player_state import PlayerState
+from src.utils.catalog import CATALOG
+
+
+def make_engine(*items):
+    player = PlayerState("テスト")
+    for item_name in items:
+        player.add_item(item_name)
+    return BattleEngine(CATALOG.guardians[0], player, rng=random.Random(0)), player
+
+
+def test_use_item_applies_effect_and_removes_it():
+    engine, player = make_engine("クラウドコーヒー", "AWS ドキュメント")
+    player.concentration = 50
+
+    assert engine.use_item("クラウドコーヒー") == {"concentration": 20}
+    assert player.concentration == 70
+    assert dict(player.items) == {"AWS ドキュメント": 1}
+    assert engine.turns == 1
+
+
+def test_use_item_twice_only_works_once():
+    engine, player = make_engine("クラウドコーヒー", "AWS ドキュメント")
+    player.concentration = 50
+
+    engine.use_item("クラウドコーヒー")
+    assert engine.use_item("クラウドコーヒー") is None
+
+    assert player.concentration == 70
+    assert dict(player.items) == {"AWS ドキュメント": 1}
+    assert engine.turns == 1
+
+
+def test_use_item_not_owned_has_no_effect():
+    engine, player = make_engine()
+    motivation = player.motivation
+
+    assert engine.use_item("モチベーションクッキー") is None
+    assert player.motivation == motivation
+    assert engine.turns == 0
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for BattleScene input handling (needs pygame; runs under the SDL dummy driver)
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+
+@pytest.fixture
+def scene_manager(screen):
+    from src.scenes.scene_manager import SceneManager
+
+    return SceneManager()
+
+
+def click(scene, button):
+    scene.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=button.rect.center, button=1))
+
+
+def test_item_menu_uses_the_items_currently_shown(scene_manager):
+    from src.scenes.battle_scene import BattleScene
+    from src.utils.catalog import CATALOG
+
+    player = scene_manager.get_player_data()
+    player.concentration = 50
+    scene_manager.add_item("クラウドコーヒー")
+    scene_manager.add_item("AWS ドキュメント")
+    scene = BattleScene(scene_manager, CATALOG.guardians[0])
+
+    # Use the coffee from the first slot
+    scene.battle_state = "player_turn"
+    scene.select_action("item")
+    first_slot = scene.item_buttons[0]
+    click(scene, first_slot)
+    assert scene.battle_state == "guardian_turn"
+    assert dict(player.items) == {"AWS ドキュメント": 1}
+
+    scene.process_guardian_attack()
+    assert scene.battle_state == "player_turn"
+
+    # The rebuilt menu shows the document in the first slot; clicking it must use the document
+    concentration = player.concentration
+    knowledge = player.aws_knowledge
+    scene.select_action("item")
+    assert scene.item_buttons[0].text == "AWS ドキュメント"
+    click(scene, first_slot)
+    assert dict(player.items) == {}
+    assert player.concentration == concentration
+    assert player.aws_knowledge == knowledge + 10
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the campaign simulator
+"""
+
+from src.engine.campaign import run_campaigns
+
+
+def test_step_limit_runs_are_unfinished_not_game_overs():
+    # One area per run can neither clear the trials nor lose to every guardian
+    report = run_campaigns(200, workers=1, seed=1, chunk_size=50, max_steps=1)
+
+    defeats = sum(report["game_over_causes"].values())
+    assert "max_steps" not in report["game_over_causes"]
+    assert report["completion_rate"] == 0.0
+    assert report["unfinished"] + defeats == report["runs"]
+    assert report["unfinished"] > 0
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for coalescing a step's events into an input snapshot
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+
+def test_snapshot_merges_motion_and_keeps_key_presses():
+    from src.utils.event_pump import snapshot_input
+
+    events = [
+        pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 10), rel=(1, 0), buttons=(False, False, False)),
+        pygame.event.Event(pygame.MOUSEMOTION, pos=(12, 15), rel=(2, 5), buttons=(False, False, False)),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, mod=0, unicode="\b"),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, mod=0, unicode="\b"),
+    ]
+    snapshot = snapshot_input(events)
+
+    assert [event.type for event in snapshot.events] == [pygame.MOUSEMOTION, pygame.KEYDOWN, pygame.KEYDOWN]
+    assert snapshot.events[0].rel == (3, 5)
+    assert snapshot.mouse_pos == (12, 15)
+    assert snapshot.keys == [pygame.K_BACKSPACE, pygame.K_BACKSPACE]
+
+    # The mouse stays where it was in a step without motion
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(40, 50), button=1)
+    assert snapshot_input([], snapshot).mouse_pos == (12, 15)
+    assert snapshot_input([click], snapshot).clicks == [(40, 50)]
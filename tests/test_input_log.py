@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the input log header
+"""
+
+import pytest
+
+pytest.importorskip("pygame")
+
+
+@pytest.mark.parametrize("seed", [-1, 0, 2 ** 63 - 1, -2 ** 63])
+def test_seed_round_trip(tmp_path, seed):
+    from src.utils.input_log import InputRecorder, read_input_log
+
+    path = tmp_path / "session.afqr"
+    recorder = InputRecorder(path, seed, 1234)
+    recorder.record_frame(1250, [])
+    recorder.close()
+
+    read_seed, start_ticks, frames = read_input_log(path)
+    assert (read_seed, start_ticks, len(frames)) == (seed, 1234, 1)
+
+
+def test_reads_version_1_unsigned_seed(tmp_path):
+    from src.utils.input_log import HEADER_V1, MAGIC, read_input_log
+
+    path = tmp_path / "old.afqr"
+    path.write_bytes(HEADER_V1.pack(MAGIC, 1, 2 ** 64 - 1, 0))
+
+    assert read_input_log(path)[0] == 2 ** 64 - 1
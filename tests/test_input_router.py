@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the input router's event filter
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+
+def test_allow_game_events_blocks_other_types(screen):
+    from src.ui.input_router import allow_game_events, GAME_EVENTS
+
+    allow_game_events()
+
+    for event_type in (pygame.JOYAXISMOTION, pygame.WINDOWSHOWN, pygame.MOUSEBUTTONUP):
+        assert pygame.event.get_blocked(event_type)
+    for event_type in GAME_EVENTS:
+        assert not pygame.event.get_blocked(event_type)
+
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(0, 0), button=1))
+    assert not pygame.event.get(pygame.MOUSEBUTTONUP)
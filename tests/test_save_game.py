@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the save format and autosave
+"""
+
+import pytest
+from src.entities.player_state import PlayerState
+from src.utils.save_game import SaveGameError, encode_save, decode_save, write_save, read_save
+
+
+def make_snapshot():
+    player = PlayerState("テスト")
+    player.add_item("クラウドコーヒー")
+    player.add_item("クラウドコーヒー")
+    player.add_skill("リソース最適化")
+    player.complete_trial("S3守護者")
+    return player.snapshot()
+
+
+def test_round_trip():
+    snapshot = make_snapshot()
+    assert decode_save(encode_save("MapScene", snapshot)) == ("MapScene", snapshot)
+
+
+def test_damaged_save_is_rejected():
+    data = bytearray(encode_save("MapScene", make_snapshot()))
+    data[-1] ^= 0xFF
+    with pytest.raises(SaveGameError):
+        decode_save(bytes(data))
+
+
+def test_slots(tmp_path):
+    snapshot = make_snapshot()
+    write_save(1, "MapScene", snapshot, tmp_path)
+    assert read_save(1, tmp_path) == ("MapScene", snapshot)
+    assert read_save(2, tmp_path) is None
+
+
+def test_load_after_defeat_resumes_before_it(screen, tmp_path, monkeypatch):
+    from src.scenes import scene_manager as scene_manager_module
+    from src.scenes.base_scene import BaseScene
+    from src.scenes.map_scene import MapScene
+    from src.utils.save_game import SaveWriter
+
+    # Saves go to tmp_path/saves
+    monkeypatch.chdir(tmp_path)
+    writer = SaveWriter()
+    monkeypatch.setattr(scene_manager_module, "save_writer", writer)
+
+    manager = scene_manager_module.SceneManager()
+    manager.autosave_slot = 0
+    manager.set_player_name("テスト")
+    manager.change_scene(BaseScene(manager))
+
+    # Lose a battle: the result screen and the map come up at motivation 0
+    manager.player_data.motivation = 0
+    manager.change_scene(BaseScene(manager))
+    manager.change_scene(BaseScene(manager))
+    writer.shutdown()
+
+    manager.autosave_slot = None
+    assert manager.load_game(0)
+    assert manager.player_data.motivation > 0
+    assert isinstance(manager.current_scene, MapScene)